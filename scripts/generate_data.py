@@ -2,18 +2,56 @@
 from __future__ import annotations
 
 import os
-import random
+import csv
+import multiprocessing as mp
 import string
-from datetime import datetime, timedelta, timezone
-import pandas as pd
+from datetime import datetime, timedelta
 import numpy as np
 
-def _rand_id(prefix: str, n=8) -> str:
-    return prefix + "".join(random.choices(string.ascii_lowercase + string.digits, k=n))
+def _rand_ids(rng: np.random.Generator, prefix: str, size: int, n=8) -> np.ndarray:
+    """`size` random ids: prefix + n chars from [a-z0-9]."""
+    chars = rng.choice(np.array(list(string.ascii_lowercase + string.digits)), size=(size, n))
+    return np.char.add(prefix, chars.view(f"<U{n}").ravel())
+
+def _customer_ids(nums: np.ndarray) -> np.ndarray:
+    return np.char.add("c", np.char.zfill(nums.astype(str), 5))
+
+def _choice(rng: np.random.Generator, values: list, size: int) -> np.ndarray:
+    # object array so None entries survive as missing values
+    return rng.choice(np.array(values, dtype=object), size=size)
+
+def _fmt(ts: np.ndarray, *, sep: str = "T", suffix: str = "") -> np.ndarray:
+    """datetime64[s] -> 'YYYY-MM-DD<sep>HH:MM:SS<suffix>' strings."""
+    out = np.datetime_as_string(ts, unit="s")
+    if sep != "T":
+        out = np.char.replace(out, "T", sep)
+    return np.char.add(out, suffix) if suffix else out
+
+def _with_duplicates(columns: dict, mask: np.ndarray, **overrides) -> dict:
+    """Re-insert the rows selected by mask right after their original (copies optionally tweaked)."""
+    idx = np.repeat(np.arange(len(mask)), np.where(mask, 2, 1))
+    is_copy = np.r_[False, idx[1:] == idx[:-1]]
+    out = {k: v[idx] for k, v in columns.items()}
+    for k, v in overrides.items():
+        col = out[k].astype(object)
+        col[is_copy] = v
+        out[k] = col
+    return out
+
+def _write_csv(columns: dict, path: str, *, batch_size: int = 4096) -> None:
+    """Stream columns to CSV in row batches through one buffered csv.writer (None -> empty)."""
+    cols = list(columns.values())
+    n = len(cols[0])
+    with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(columns.keys())
+        for start in range(0, n, batch_size):
+            w.writerows(zip(*(c[start:start + batch_size].tolist() for c in cols)))
 
 def make_day(ingest_date: str, out_dir: str, *, n_customers=200, n_events=5000, n_orders=400, partial_load=False, seed=42):
-    random.seed(seed + int(ingest_date.replace("-","")))
-    np.random.seed(seed + int(ingest_date.replace("-","")))
+    # per-call RNG (seeded from the date) so days can run in parallel;
+    # every column is drawn as a whole array instead of row by row
+    rng = np.random.default_rng(seed + int(ingest_date.replace("-","")))
 
     day_dir = os.path.join(out_dir, f"ingest_date={ingest_date}")
     os.makedirs(day_dir, exist_ok=True)
@@ -21,111 +59,124 @@ def make_day(ingest_date: str, out_dir: str, *, n_customers=200, n_events=5000,
     # Customers
     countries = ["US","usa","United States","IN","india","GB","uk","BR","N/A",None]
     statuses = ["active","ACTIVE","inactive","banned","",None,"actve"]
-    rows = []
-    base_created = datetime(2025, 1, 1, tzinfo=timezone.utc)
-    for i in range(n_customers):
-        cid = f"c{i:05d}"
-        created = base_created + timedelta(days=random.randint(0, 300), hours=random.randint(0,23))
-        # messy formats
-        created_str = created.strftime("%Y-%m-%d %H:%M:%S") if random.random() < 0.6 else created.isoformat()
-        email = f"user{i}@example.com" if random.random() < 0.9 else f"user{i}example.com"
-        rows.append({
-            "customer_id": cid,
-            "email": email,
-            "created_at": created_str,
-            "country": random.choice(countries),
-            "status": random.choice(statuses),
-            "ingest_date": ingest_date if random.random() < 0.9 else "2099-01-01"
-        })
-        # duplicates
-        if random.random() < 0.05:
-            rows.append(rows[-1] | {"created_at": "not a date"})
-    customers = pd.DataFrame(rows)
-    customers.to_csv(os.path.join(day_dir, "customers_raw.csv"), index=False)
+    n = n_customers
+    idx = np.arange(n).astype(str)
+    base_created = np.datetime64("2025-01-01T00:00:00", "s")
+    created = (
+        base_created
+        + rng.integers(0, 301, n).astype("timedelta64[D]")
+        + rng.integers(0, 24, n).astype("timedelta64[h]")
+    )
+    # messy formats
+    created_str = np.where(
+        rng.random(n) < 0.6,
+        _fmt(created, sep=" "),
+        _fmt(created, suffix="+00:00"),
+    )
+    email = np.where(
+        rng.random(n) < 0.9,
+        np.char.add(np.char.add("user", idx), "@example.com"),
+        np.char.add(np.char.add("user", idx), "example.com"),
+    )
+    customers = {
+        "customer_id": _customer_ids(np.arange(n)),
+        "email": email,
+        "created_at": created_str,
+        "country": _choice(rng, countries, n),
+        "status": _choice(rng, statuses, n),
+        "ingest_date": np.where(rng.random(n) < 0.9, ingest_date, "2099-01-01"),
+    }
+    # duplicates
+    customers = _with_duplicates(customers, rng.random(n) < 0.05, created_at="not a date")
+    _write_csv(customers, os.path.join(day_dir, "customers_raw.csv"))
 
     # Events
     event_types = ["login","feature_use","error","Logout","FEATURE_USE","",None,"paywall_view"]
     platforms = ["ios","android","web","iPhone","browser","AND","",None]
-    events = []
-    start = datetime.strptime(ingest_date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    n = n_events
+    start = np.datetime64(ingest_date, "s")
 
+    cid = _customer_ids(rng.integers(0, n_customers, n))
+    # orphans
+    cid = np.where(rng.random(n) < 0.02, np.char.add("unknown_", cid), cid)
+
+    hr = rng.integers(0, 24, n)
     # If partial_load, skip 6 consecutive hours
-    missing_hours = set()
     if partial_load:
-        h0 = random.randint(0, 10)
-        missing_hours = set(range(h0, h0+6))
-
-    for i in range(n_events):
-        eid = _rand_id("e")
-        cid = f"c{random.randint(0, n_customers-1):05d}"
-        # orphans
-        if random.random() < 0.02:
-            cid = "unknown_" + cid
-
-        hr = random.randint(0, 23)
-        if hr in missing_hours:
-            hr = (hr + 7) % 24
-        ts = start + timedelta(hours=hr, minutes=random.randint(0,59), seconds=random.randint(0,59))
-        # messy timestamp formats/timezones
-        if random.random() < 0.6:
-            ts_str = ts.strftime("%Y-%m-%d %H:%M:%S")
-        elif random.random() < 0.85:
-            ts_str = ts.astimezone(timezone(timedelta(hours=-5))).isoformat()  # -05:00
-        else:
-            ts_str = "bad-ts"
-
-        dur = int(np.random.exponential(scale=120000))  # ms
-        if random.random() < 0.01:
-            dur = -dur
-        if random.random() < 0.005:
-            dur = 999999999  # absurd
-
-        events.append({
-            "event_id": eid,
-            "customer_id": cid,
-            "event_time": ts_str,
-            "event_type": random.choice(event_types),
-            "platform": random.choice(platforms),
-            "session_id": _rand_id("s") if random.random() < 0.8 else "",
-            "duration_ms": dur,
-            "ingest_date": ingest_date
-        })
-        # duplicate IDs
-        if random.random() < 0.01:
-            events.append(events[-1])
-    pd.DataFrame(events).to_csv(os.path.join(day_dir, "events_raw.csv"), index=False)
+        h0 = rng.integers(0, 11)
+        missing = (hr >= h0) & (hr < h0 + 6)
+        hr = np.where(missing, (hr + 7) % 24, hr)
+    ts = (
+        start
+        + hr.astype("timedelta64[h]")
+        + rng.integers(0, 60, n).astype("timedelta64[m]")
+        + rng.integers(0, 60, n).astype("timedelta64[s]")
+    )
+    # messy timestamp formats/timezones
+    fmt_draw = rng.random(n)
+    ts_str = np.where(
+        fmt_draw < 0.6,
+        _fmt(ts, sep=" "),
+        np.where(
+            rng.random(n) < 0.85,
+            _fmt(ts - np.timedelta64(5, "h"), suffix="-05:00"),
+            "bad-ts",
+        ),
+    )
+
+    dur = rng.exponential(scale=120000, size=n).astype(np.int64)  # ms
+    dur = np.where(rng.random(n) < 0.01, -dur, dur)
+    dur = np.where(rng.random(n) < 0.005, 999999999, dur)  # absurd
+
+    events = {
+        "event_id": _rand_ids(rng, "e", n),
+        "customer_id": cid,
+        "event_time": ts_str,
+        "event_type": _choice(rng, event_types, n),
+        "platform": _choice(rng, platforms, n),
+        "session_id": np.where(rng.random(n) < 0.8, _rand_ids(rng, "s", n), ""),
+        "duration_ms": dur,
+        "ingest_date": np.full(n, ingest_date),
+    }
+    # duplicate IDs
+    events = _with_duplicates(events, rng.random(n) < 0.01)
+    _write_csv(events, os.path.join(day_dir, "events_raw.csv"))
 
     # Orders
     currencies = ["USD","usd","$","EUR","€","???",None]
     order_status = ["paid","PAID","failed","refunded","chargeback","",None,"succeeded"]
-    orders = []
-    for i in range(n_orders):
-        oid = _rand_id("o")
-        cid = f"c{random.randint(0, n_customers-1):05d}"
-        if random.random() < 0.03:
-            cid = "unknown_" + cid
-
-        ts = start + timedelta(hours=random.randint(0,23), minutes=random.randint(0,59))
-        ts_str = ts.isoformat() if random.random() < 0.8 else "not-a-time"
-
-        amt = round(float(np.random.gamma(shape=2.0, scale=20.0)), 2)
-        if random.random() < 0.02:
-            amt = -amt
-        if random.random() < 0.02:
-            amt = None
-
-        orders.append({
-            "order_id": oid,
-            "customer_id": cid,
-            "order_time": ts_str,
-            "amount": amt,
-            "currency": random.choice(currencies),
-            "status": random.choice(order_status),
-            "ingest_date": ingest_date
-        })
-        if random.random() < 0.01:
-            orders.append(orders[-1])
-    pd.DataFrame(orders).to_csv(os.path.join(day_dir, "orders_raw.csv"), index=False)
+    n = n_orders
+
+    cid = _customer_ids(rng.integers(0, n_customers, n))
+    cid = np.where(rng.random(n) < 0.03, np.char.add("unknown_", cid), cid)
+
+    ts = (
+        start
+        + rng.integers(0, 24, n).astype("timedelta64[h]")
+        + rng.integers(0, 60, n).astype("timedelta64[m]")
+    )
+    ts_str = np.where(rng.random(n) < 0.8, _fmt(ts, suffix="+00:00"), "not-a-time")
+
+    amt = np.round(rng.gamma(shape=2.0, scale=20.0, size=n), 2).astype(object)
+    amt = np.where(rng.random(n) < 0.02, -amt, amt)
+    amt = np.where(rng.random(n) < 0.02, None, amt)  # missing amount
+
+    orders = {
+        "order_id": _rand_ids(rng, "o", n),
+        "customer_id": cid,
+        "order_time": ts_str,
+        "amount": amt,
+        "currency": _choice(rng, currencies, n),
+        "status": _choice(rng, order_status, n),
+        "ingest_date": np.full(n, ingest_date),
+    }
+    orders = _with_duplicates(orders, rng.random(n) < 0.01)
+    _write_csv(orders, os.path.join(day_dir, "orders_raw.csv"))
+
+def _make_day_task(task: tuple) -> str:
+    ingest_date, out_dir, partial_load, seed = task
+    make_day(ingest_date, out_dir, partial_load=partial_load, seed=seed)
+    return ingest_date
 
 def main():
     import argparse
@@ -134,19 +185,31 @@ def main():
     ap.add_argument("--start", required=True)
     ap.add_argument("--end", required=True)
     ap.add_argument("--seed", type=int, default=42)
+    ap.add_argument("--workers", type=int, default=1, help="parallel processes (default: 1, all days in this process)")
     ap.add_argument("--partial_load_every", type=int, default=3, help="every Nth day is partial load (0 disables)")
     args = ap.parse_args()
 
     s = datetime.strptime(args.start, "%Y-%m-%d").date()
     e = datetime.strptime(args.end, "%Y-%m-%d").date()
+    tasks = []
     cur = s
     idx = 0
     while cur <= e:
         d = cur.strftime("%Y-%m-%d")
-        partial = (args.partial_load_every and idx % args.partial_load_every == 0)
-        make_day(d, args.out_dir, partial_load=partial, seed=args.seed)
+        partial = bool(args.partial_load_every and idx % args.partial_load_every == 0)
+        tasks.append((d, args.out_dir, partial, args.seed))
         cur += timedelta(days=1)
         idx += 1
 
+    # days are independent (each seeded from its own date) -> fan out across processes
+    workers = args.workers
+    if workers <= 1 or len(tasks) == 1:
+        for t in tasks:
+            _make_day_task(t)
+    else:
+        with mp.Pool(processes=min(workers, len(tasks))) as pool:
+            for _ in pool.imap_unordered(_make_day_task, tasks):
+                pass
+
 if __name__ == "__main__":
     main()
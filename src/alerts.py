@@ -38,7 +38,12 @@ def detect_partial_load(
             }
         })
     else:
-        day_df = hourly_events[hourly_events["ingest_date"] == ingest_date].copy()
+        # read-only from here on: no copy; a frame already scoped to today needs no filter
+        dates = hourly_events["ingest_date"]
+        if (dates == ingest_date).all():
+            day_df = hourly_events
+        else:
+            day_df = hourly_events[dates == ingest_date]
 
         if day_df.empty:
             alerts["flags"].append({
@@ -55,7 +60,7 @@ def detect_partial_load(
             zero_hours = int((day_df["event_count"].fillna(0) == 0).sum())
 
             # if hourly table doesn't contain all hours, count missing hours too
-            present_hours = int(day_df["hour_utc"].nunique())
+            present_hours = int(day_df["hour_utc"].dropna().drop_duplicates().size)
             missing_hours = int(max(0, expected_hours - present_hours))
 
             total_bad_hours = zero_hours + missing_hours
@@ -77,25 +82,27 @@ def detect_partial_load(
     if daily_metrics_history is None or daily_metrics_history.empty:
         return alerts
 
-    hist = daily_metrics_history.copy()
-
     # must contain today's row + the metric we compare
-    if "ingest_date" not in hist.columns or "events_clean" not in hist.columns:
+    if "ingest_date" not in daily_metrics_history.columns or "events_clean" not in daily_metrics_history.columns:
         return alerts
 
-    hist["ingest_date"] = hist["ingest_date"].astype(str)
+    # narrow view of the two columns we need (no full-history copy)
+    hist = daily_metrics_history[["ingest_date", "events_clean"]].astype({"ingest_date": str})
     hist = hist.sort_values("ingest_date")
 
+    # hist is sorted by date, so today's row and the prior days are found by binary search
+    # instead of two full-history comparisons
+    pos = int(hist["ingest_date"].searchsorted(ingest_date, side="left"))
+
     # today's volume
-    today_row = hist[hist["ingest_date"] == ingest_date]
-    if today_row.empty:
+    if pos == len(hist) or hist["ingest_date"].iloc[pos] != ingest_date:
         # If this happens, you likely called detect_partial_load BEFORE upserting today's metrics.
         return alerts
 
-    today_events_clean = float(today_row.iloc[0]["events_clean"])
+    today_events_clean = float(hist["events_clean"].iloc[pos])
 
     # trailing baseline (prior days only)
-    prior = hist[hist["ingest_date"] < ingest_date].tail(trailing_days)
+    prior = hist.iloc[max(0, pos - trailing_days):pos]
     if prior.empty:
         return alerts
 
@@ -2,29 +2,88 @@
 from __future__ import annotations
 
 
+import numpy as np
 import pandas as pd
+from .io import EVENT_DTYPES
 from .utils import (
-    is_valid_email,
-    normalize_currency,
-    normalize_platform,
-    normalize_customer_status,
-    normalize_customer_id,
-    normalize_order_status,
-    normalize_country,
-    parse_timestamp_to_utc,
-    safe_float,
+    is_valid_email_series,
+    normalize_currency_series,
+    normalize_platform_series,
+    normalize_customer_status_series,
+    normalize_customer_id_series,
+    normalize_order_status_series,
+    normalize_country_series,
+    parse_timestamp_to_utc_series,
+    safe_float_series,
 )
 
+# Low-cardinality text columns: stored as category so sorts/groupbys/dedupes
+# compare small integer codes instead of Python strings.
+CATEGORICAL_COLUMNS = ("country", "status", "platform", "event_type", "currency", "ingest_date")
+
+def to_categorical(df: pd.DataFrame, columns=CATEGORICAL_COLUMNS) -> pd.DataFrame:
+    for c in columns:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    return df
+
+def drop_raw_duplicates(df: pd.DataFrame, key: str) -> pd.DataFrame:
+    """
+    Drop exact raw duplicate rows (keep last). They normalize identically, so removing
+    them first means the normalizers only run over distinct rows. Returns the input
+    frame itself when there is nothing to drop (callers never mutate it).
+
+    Identical rows share `key`, so only rows with a repeated key are compared across
+    all columns; everything else costs a single-column hash.
+    """
+    candidates = df[key].duplicated(keep=False).to_numpy()
+    if not candidates.any():
+        return df
+    dup = np.zeros(len(df), dtype=bool)
+    dup[candidates] = df[candidates].duplicated(keep="last").to_numpy()
+    return df[~dup] if dup.any() else df
+
+def has_real_value(series: pd.Series) -> pd.Series:
+    """Text columns: treat empty/whitespace and "nan"/"none"/"null" strings as missing."""
+    s = series.astype("string").str.strip()
+    return s.notna() & s.ne("") & ~s.str.lower().isin(["nan", "none", "null"])
+
+def pack_flags(flags: list[pd.Series]) -> pd.Series:
+    """Bit-pack boolean flags into one uint8 score; earlier flags get higher bits."""
+    score = np.zeros(len(flags[0]), dtype=np.uint8)
+    for flag in flags:
+        score = (score << 1) | flag.to_numpy(dtype=np.uint8)
+    return pd.Series(score, index=flags[0].index)
+
+def keep_best_per_key(df: pd.DataFrame, key: str, levels: list[pd.Series]) -> pd.DataFrame:
+    """
+    Keep one row per `key`: the row with the highest `levels` (compared in priority
+    order, missing values lose), and the last occurrence when everything ties.
+
+    Same result as sort_values([key, *levels]) + drop_duplicates(key, keep="last"),
+    but each level is a hashed groupby-max instead of an O(N log N) multi-key sort.
+    """
+    keep = pd.Series(True, index=df.index)
+    for level in levels:
+        candidate = level.where(keep)
+        best = candidate.groupby(df[key], dropna=False).transform("max")
+        keep &= (candidate == best) | best.isna()
+    return df[keep].drop_duplicates(subset=[key], keep="last")
+
 def clean_customers(df: pd.DataFrame, ingest_date: str) -> pd.DataFrame:
-    df = df.copy()
-    df["customer_id"] = df["customer_id"].apply(normalize_customer_id)
-    df["email"] = df["email"].astype(str).str.strip()
-    df["email_valid"] = df["email"].apply(is_valid_email)
+    df = drop_raw_duplicates(df, "customer_id")
+
+    # build the output column by column (untouched columns are shared, not copied)
+    out = dict(df.items())
+    out["customer_id"] = normalize_customer_id_series(df["customer_id"])
+    out["email"] = df["email"].astype(str).str.strip()
+    out["email_valid"] = is_valid_email_series(out["email"])
 
-    df["created_at_utc"] = df["created_at"].apply(parse_timestamp_to_utc)
-    df["country"] = df["country"].apply(normalize_country)
-    df["status"] = df["status"].apply(normalize_customer_status)
-    df["ingest_date"] = ingest_date
+    out["created_at_utc"] = parse_timestamp_to_utc_series(df["created_at"])
+    out["country"] = normalize_country_series(df["country"])
+    out["status"] = normalize_customer_status_series(df["status"])
+    out["ingest_date"] = ingest_date
+    df = to_categorical(pd.DataFrame(out, index=df.index, copy=False))
 
     # TODO: Candidate: implement dedupe strategy (e.g., latest created_at_utc, then prefer valid email)
     # df = df.sort_values(["customer_id", "created_at_utc"], ascending=[True, True])
@@ -40,22 +99,24 @@ def clean_customers(df: pd.DataFrame, ingest_date: str) -> pd.DataFrame:
     return df
 
 def clean_events(df: pd.DataFrame, ingest_date: str) -> pd.DataFrame:
-    df = df.copy()
-    df["event_id"] = df["event_id"].astype(str).str.strip()
-    df["customer_id"] = df["customer_id"].apply(normalize_customer_id)
+    df = drop_raw_duplicates(df, "event_id")
 
-    df["event_time_utc"] = df["event_time"].apply(parse_timestamp_to_utc)
-    df["event_type"] = df["event_type"].astype(str).str.strip().str.lower()
-    df["platform"] = df["platform"].apply(normalize_platform)
-    df["session_id"] = df["session_id"].astype(str).str.strip()
-    df["duration_ms"] = df["duration_ms"].apply(safe_float)
+    out = dict(df.items())
+    out["event_id"] = df["event_id"].astype(str).str.strip()
+    out["customer_id"] = normalize_customer_id_series(df["customer_id"])
 
-    df["ingest_date"] = ingest_date
+    out["event_time_utc"] = parse_timestamp_to_utc_series(df["event_time"])
+    out["event_type"] = df["event_type"].astype(str).str.strip().str.lower()
+    out["platform"] = normalize_platform_series(df["platform"])
+    out["session_id"] = df["session_id"].astype(str).str.strip()
+    out["duration_ms"] = safe_float_series(df["duration_ms"])
 
-    # TODO: Candidate: define & implement dedupe policy (event_id duplicates vs full row duplicates)
-    # Full-row duplicates:
+    out["ingest_date"] = ingest_date
+    df = to_categorical(pd.DataFrame(out, index=df.index, copy=False))
 
-    df = df.drop_duplicates(keep="last")
+    # TODO: Candidate: define & implement dedupe policy (event_id duplicates vs full row duplicates)
+    # Full-row duplicates: no separate pass. Identical rows share event_id, quality and
+    # event_time_utc, so the event_id pass below already collapses them to the last one.
 
     # event_id dedupe policy:
     # Prefer (in order):
@@ -68,100 +129,76 @@ def clean_events(df: pd.DataFrame, ingest_date: str) -> pd.DataFrame:
     #   latest event_time_utc
     #   otherwise keep last occurrence
 
-    # treat empty/whitespace and string nulls as missing for text columns
-    def has_real_value(series: pd.Series) -> pd.Series:
-        s = series.astype("string").str.strip()
-        return s.notna() & s.ne("") & ~s.str.lower().isin(["nan", "none", "null"])
-
-    #I create helper flags to rank records by quality.
-    df["has_event_time"] = df["event_time_utc"].notna().astype(int)
-    df["has_customer"] = has_real_value(df["customer_id"]).astype(int)
-    df["has_event_type"] = has_real_value(df["event_type"]).astype(int)
-    df["has_platform"] = df["platform"].notna().astype(int)  # normalize_platform returns None if unknown
-    df["has_session"] = has_real_value(df["session_id"]).astype(int)
-    df["has_duration"] = df["duration_ms"].notna().astype(int)
-
-    # Sort so the best record becomes LAST per event_id; then keep="last"
-    df = df.sort_values(
-        by=[
-            "event_id",
-            "has_event_time",
-            "has_customer",
-            "has_event_type",
-            "has_platform",
-            "has_session",
-            "has_duration",
-            "event_time_utc" 
-                  
-        ],
-        ascending=[True, True, True, True, True, True, True, True],
-    )
-
-    df = df.drop_duplicates(subset=["event_id"], keep="last")
-
-    # cleanup helper columns
-    df = df.drop(
-        columns=[
-            "has_event_time",
-            "has_customer",
-            "has_event_type",
-            "has_platform",
-            "has_session",
-            "has_duration",
-        ]
-    )
-
-    return df
+    return dedupe_events(df)
+
+def event_quality(df: pd.DataFrame) -> pd.Series:
+    # Pack the completeness flags into one score (earlier flag = higher bit),
+    # so "best" is a lexicographic max instead of a multi-key sort.
+    return pack_flags([
+        df["event_time_utc"].notna(),
+        df["customer_id"].notna(),  # normalized: a valid id or missing
+        has_real_value(df["event_type"]),
+        df["platform"].notna(),  # normalize_platform returns None if unknown
+        has_real_value(df["session_id"]),
+        df["duration_ms"].notna(),
+    ])
+
+def dedupe_events(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the best row per event_id of an already-normalized events frame."""
+    return keep_best_per_key(df, "event_id", [event_quality(df), df["event_time_utc"]])
+
+def clean_events_streaming(chunks, ingest_date: str) -> pd.DataFrame:
+    """
+    clean_events over an iterable of raw chunks (e.g. read_csv(..., chunksize=N)).
+
+    Only one raw chunk is alive at a time during normalization; each chunk is reduced to
+    its best row per event_id, and a final event_id pass settles ids that span chunks.
+    The winner of a group is the last row with the best ranking, so picking per chunk
+    first and then across chunks (in chunk order) gives the same rows as clean_events
+    on the whole file.
+    """
+    parts = [clean_events(chunk, ingest_date) for chunk in chunks]
+    if not parts:
+        return clean_events(pd.DataFrame(columns=list(EVENT_DTYPES), dtype="str"), ingest_date)
+    if len(parts) == 1:
+        return parts[0]
+    # chunk categories differ, so concat falls back to object; re-encode afterwards
+    df = to_categorical(pd.concat(parts))
+    return dedupe_events(df)
 
 def clean_orders(df: pd.DataFrame, ingest_date: str) -> pd.DataFrame:
-    df = df.copy()
-    df["order_id"] = df["order_id"].astype(str).str.strip()
-    df["customer_id"] = df["customer_id"].apply(normalize_customer_id)
+    df = drop_raw_duplicates(df, "order_id")
+
+    out = dict(df.items())
+    out["order_id"] = df["order_id"].astype(str).str.strip()
+    out["customer_id"] = normalize_customer_id_series(df["customer_id"])
 
-    df["order_time_utc"] = df["order_time"].apply(parse_timestamp_to_utc)
-    df["amount"] = df["amount"].apply(safe_float)
-    df["currency"] = df["currency"].apply(normalize_currency)
-    df["status"] = df["status"].apply(normalize_order_status)
+    out["order_time_utc"] = parse_timestamp_to_utc_series(df["order_time"])
+    out["amount"] = safe_float_series(df["amount"])
+    out["currency"] = normalize_currency_series(df["currency"])
+    out["status"] = normalize_order_status_series(df["status"])
 
-    df["ingest_date"] = ingest_date
+    out["ingest_date"] = ingest_date
+    df = to_categorical(pd.DataFrame(out, index=df.index, copy=False))
 
     # Full-row duplicates
-    # If two rows are identical across ALL columns, keep the last one
-    df = df.drop_duplicates(keep="last")
+    # If two rows are identical across ALL columns (after normalization), keep the last one.
+    # Folded into the order_id pass: identical rows tie on every ranking level there.
 
   
     # 3) order_id dedupe policy
     
-    # helper: for text columns, treat empty/whitespace/"nan"/"none"/"null" as missing
-    def has_real_value(series: pd.Series) -> pd.Series:
-        s = series.astype("string").str.strip()
-        return s.notna() & s.ne("") & ~s.str.lower().isin(["nan", "none", "null"])
-
-    df["has_order_time"] = df["order_time_utc"].notna().astype(int)
-    df["has_customer"]   = has_real_value(df["customer_id"]).astype(int)
-    df["has_amount"]     = df["amount"].notna().astype(int)
-    df["has_currency"]   = has_real_value(df["currency"]).astype(int)
-    df["has_status"]     = has_real_value(df["status"]).astype(int)
-
-    # Sort so the "best" row becomes LAST for each order_id, then keep="last"
-    df = df.sort_values(
-        by=[
-            "order_id",
-            "has_order_time",
-            "has_customer",
-            "has_amount",
-            "has_currency",
-            "has_status",
-            "order_time_utc",
-        ],
-        ascending=[True, True, True, True, True, True, True],
-    )
-
-    df = df.drop_duplicates(subset=["order_id"], keep="last")
-
-    # cleanup helper cols
-    df = df.drop(
-        columns=["has_order_time", "has_customer", "has_amount", "has_currency", "has_status"]
-    )
+    # "best" row per order_id: most complete, then latest order_time_utc, then last seen
+    quality = pack_flags([
+        df["order_time_utc"].notna(),
+        # customer_id/currency/status are normalized already (canonical value or missing),
+        # so a null check is all the string scan would tell us
+        df["customer_id"].notna(),
+        df["amount"].notna(),
+        df["currency"].notna(),
+        df["status"].notna(),
+    ])
+
+    df = keep_best_per_key(df, "order_id", [quality, df["order_time_utc"]])
 
     return df
@@ -1,6 +1,7 @@
 \
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from typing import Optional,List
 
@@ -12,11 +13,12 @@ def compute_hourly_events(events_clean: pd.DataFrame) -> pd.DataFrame:
     """
     if events_clean.empty:
         return pd.DataFrame(columns=["ingest_date", "hour_utc", "event_count"])
-    df = events_clean.copy()
-    df["hour_utc"] = df["event_time_utc"].dt.floor("h")
-    out = df.groupby(["ingest_date", "hour_utc"], as_index=False).size()
-    out = out.rename(columns={"size": "event_count"})
-    return out
+    # group on derived key Series directly; no need to copy the events frame
+    hour_utc = events_clean["event_time_utc"].dt.floor("h").rename("hour_utc")
+    ingest_date = events_clean["ingest_date"].astype("category")
+    # observed=True: only emit (ingest_date, hour) pairs that actually occur
+    out = events_clean.groupby([ingest_date, hour_utc], observed=True).size()
+    return out.reset_index(name="event_count")
 
 def compute_daily_metrics(
     ingest_date: str,
@@ -45,10 +47,13 @@ def compute_daily_metrics(
     def p50_p95(df: pd.DataFrame, col: str) -> tuple[float, float]:
         if df is None or df.empty or col not in df.columns:
             return (0.0, 0.0)
-        s = pd.to_numeric(df[col], errors="coerce").dropna()
-        if s.empty:
+        arr = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+        arr = arr[~np.isnan(arr)]
+        if arr.size == 0:
             return (0.0, 0.0)
-        return (float(s.quantile(0.50)), float(s.quantile(0.95)))
+        # one partition for both quantiles (same linear interpolation as Series.quantile)
+        p50, p95 = np.quantile(arr, [0.50, 0.95])
+        return (float(p50), float(p95))
 
     def id_duplicate_rate(df: pd.DataFrame, id_col: str) -> float:
         """
@@ -56,15 +61,24 @@ def compute_daily_metrics(
         """
         if df is None or df.empty or id_col not in df.columns:
             return 0.0
-        dup_mask = df[id_col].duplicated(keep=False)
-        return float(dup_mask.mean())
+        # rows in groups of size > 1, straight from the id counts (no per-row mask)
+        counts = df[id_col].value_counts(dropna=False).to_numpy()
+        return float(counts[counts > 1].sum() / len(df))
 
-    def full_row_duplicate_rate(df: pd.DataFrame, subset_cols: Optional[List[str]] = None) -> float:
+    def full_row_duplicate_rate(df: pd.DataFrame, subset_cols: Optional[List[str]] = None, id_col: Optional[str] = None) -> float:
         """
         % of rows that are duplicates (based on subset or full row).
+
+        With `id_col`, only rows whose id repeats are compared across all columns
+        (identical rows share the id); unique ids cost a single-column hash.
         """
         if df is None or df.empty:
             return 0.0
+        if id_col is not None and not subset_cols and id_col in df.columns:
+            candidates = df[id_col].duplicated(keep=False).to_numpy()
+            if not candidates.any():
+                return 0.0
+            return float(df[candidates].duplicated(keep=False).sum() / len(df))
         if subset_cols:
             subset_cols = [c for c in subset_cols if c in df.columns]
             if not subset_cols:
@@ -74,23 +88,40 @@ def compute_daily_metrics(
             dup_mask = df.duplicated(keep=False)
         return float(dup_mask.mean())
 
-    def orphan_rate(df: pd.DataFrame, customers_df: pd.DataFrame, customer_id_col: str = "customer_id") -> float:
+    def factorize_ids(df: pd.DataFrame, col: str = "customer_id"):
+        """
+        (codes, uniques) for df[col], or None for empty/missing. One hash pass that
+        serves both the distinct count and the orphan lookup (missing ids get code -1).
+        """
+        if df is None or df.empty or col not in df.columns:
+            return None
+        return pd.factorize(df[col])
+
+    def orphan_rate(ids, valid_ids: pd.Index | None) -> float:
         """
-        % of rows where customer_id is not present in customers_clean
+        % of rows where customer_id is not present in customers_clean (`valid_ids`)
         """
-        if df is None or df.empty or customer_id_col not in df.columns:
+        if ids is None:
             return 0.0
-        if customers_df is None or customers_df.empty or customer_id_col not in customers_df.columns:
+        if valid_ids is None:
             # if customers is empty, treat everything as orphan
             return 1.0
-        valid = set(customers_df[customer_id_col].dropna().astype(str))
-        cid = df[customer_id_col].astype(str)
-        return float((~cid.isin(valid)).mean())
+        codes, uniques = ids
+        # look up each distinct id once; slot -1 (missing id) is never known
+        known = np.append(pd.Index(uniques).isin(valid_ids), False)
+        return float(1.0 - known[codes].mean())
 
     def breakdown_counts(df: pd.DataFrame, col: str) -> dict:
         if df is None or df.empty or col not in df.columns:
             return {}
-        return df[col].astype("string").fillna("NULL").value_counts().to_dict()
+        s = df[col]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            # count the integer codes directly (slot 0 collects NaN's -1 code)
+            counts = np.bincount(s.cat.codes.to_numpy() + 1, minlength=len(s.cat.categories) + 1)
+            counts = pd.Series(counts, index=["NULL", *s.cat.categories.astype(str)])
+            counts = counts[counts > 0].sort_values(ascending=False, kind="stable")
+            return {k: int(v) for k, v in counts.items()}
+        return s.astype("string").fillna("NULL").value_counts().to_dict()
 
     # ---------- counts ----------
     customers_total = len(customers_clean) + len(customers_quarantine)
@@ -98,8 +129,10 @@ def compute_daily_metrics(
     orders_total = len(orders_clean) + len(orders_quarantine)
 
     # ---------- active customers ----------
-    active_customers_events = int(events_clean["customer_id"].nunique()) if (not events_clean.empty and "customer_id" in events_clean.columns) else 0
-    active_customers_orders = int(orders_clean["customer_id"].nunique()) if (not orders_clean.empty and "customer_id" in orders_clean.columns) else 0
+    events_customer_ids = factorize_ids(events_clean)
+    orders_customer_ids = factorize_ids(orders_clean)
+    active_customers_events = len(events_customer_ids[1]) if events_customer_ids else 0
+    active_customers_orders = len(orders_customer_ids[1]) if orders_customer_ids else 0
 
     # ---------- quarantine rates ----------
     quarantine_rate_customers = safe_rate(len(customers_quarantine), customers_total)
@@ -107,28 +140,33 @@ def compute_daily_metrics(
     quarantine_rate_orders = safe_rate(len(orders_quarantine), orders_total)
 
     # ---------- quality: invalid timestamp rates ----------
-    # we approximate using (clean + quarantine) as clean_raw
-    events_for_ts = events_cleaned_raw if events_cleaned_raw is not None else pd.concat([events_clean, events_quarantine], ignore_index=True)
-    orders_for_ts = orders_cleaned_raw if orders_cleaned_raw is not None else pd.concat([orders_clean, orders_quarantine], ignore_index=True)
+    # we approximate using (clean + quarantine) as clean_raw; built once and shared by
+    # the timestamp and duplicate checks below
+    events_all = events_cleaned_raw if events_cleaned_raw is not None else pd.concat([events_clean, events_quarantine], ignore_index=True)
+    orders_all = orders_cleaned_raw if orders_cleaned_raw is not None else pd.concat([orders_clean, orders_quarantine], ignore_index=True)
 
-    invalid_event_ts_rate = null_rate(events_for_ts, "event_time_utc")   # invalid parse typically becomes NaT
-    invalid_order_ts_rate = null_rate(orders_for_ts, "order_time_utc")
+    invalid_event_ts_rate = null_rate(events_all, "event_time_utc")   # invalid parse typically becomes NaT
+    invalid_order_ts_rate = null_rate(orders_all, "order_time_utc")
 
     # ---------- quality: orphan customer_id rates ----------
-    orphan_rate_events = orphan_rate(events_clean, customers_clean, "customer_id")
-    orphan_rate_orders = orphan_rate(orders_clean, customers_clean, "customer_id")
+    # hash the clean customer ids once for both lookups
+    if customers_clean is None or customers_clean.empty or "customer_id" not in customers_clean.columns:
+        valid_customer_ids = None
+    else:
+        # no .unique(): isin hashes the lookup side anyway, and clean customer ids are
+        # already one row per id
+        valid_customer_ids = pd.Index(customers_clean["customer_id"].dropna())
+    orphan_rate_events = orphan_rate(events_customer_ids, valid_customer_ids)
+    orphan_rate_orders = orphan_rate(orders_customer_ids, valid_customer_ids)
 
     # ---------- quality: duplicate rates ----------
     # Use cleaned_raw if you want duplicates BEFORE validation split
-    events_for_dups = events_cleaned_raw if events_cleaned_raw is not None else pd.concat([events_clean, events_quarantine], ignore_index=True)
-    orders_for_dups = orders_cleaned_raw if orders_cleaned_raw is not None else pd.concat([orders_clean, orders_quarantine], ignore_index=True)
-
-    events_dup_id_rate = id_duplicate_rate(events_for_dups, "event_id")
-    orders_dup_id_rate = id_duplicate_rate(orders_for_dups, "order_id")
+    events_dup_id_rate = id_duplicate_rate(events_all, "event_id")
+    orders_dup_id_rate = id_duplicate_rate(orders_all, "order_id")
 
     # full-row duplicates
-    events_dup_fullrow_rate = full_row_duplicate_rate(events_for_dups)
-    orders_dup_fullrow_rate = full_row_duplicate_rate(orders_for_dups)
+    events_dup_fullrow_rate = full_row_duplicate_rate(events_all, id_col="event_id")
+    orders_dup_fullrow_rate = full_row_duplicate_rate(orders_all, id_col="order_id")
 
     # ---------- quality: null rates for key columns ----------
     customers_email_null_rate = null_rate(customers_clean, "email")
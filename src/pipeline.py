@@ -2,14 +2,23 @@
 from __future__ import annotations
 
 import argparse
+import multiprocessing as mp
 import os
 from datetime import datetime, timedelta
 import pandas as pd
 from rich.console import Console
 
-from .io import read_csv, write_parquet, write_json
-from .cleaning import clean_customers, clean_events, clean_orders
+from .io import (
+    migrate_single_file_dataset,
+    read_csv,
+    read_metrics_history,
+    write_date_partition,
+    write_json,
+    write_parquet,
+)
+from .cleaning import clean_customers, clean_events, clean_events_streaming, clean_orders
 from .validation import (
+    customer_key_index,
     split_clean_quarantine_customers,
     split_clean_quarantine_events,
     split_clean_quarantine_orders,
@@ -34,54 +43,48 @@ def load_day(data_dir: str, ingest_date: str):
     orders_path = os.path.join(base, "orders_raw.csv")
     return customers_path, events_path, orders_path
 
-def upsert_daily_metrics(metrics_path: str, new_row: pd.DataFrame) -> None:
-    os.makedirs(os.path.dirname(metrics_path), exist_ok=True)
-    if os.path.exists(metrics_path):
-        old = pd.read_parquet(metrics_path)
-        # overwrite row for same ingest_date (idempotent)
-        old = old[old["ingest_date"] != new_row.loc[0, "ingest_date"]]
-        out = pd.concat([old, new_row], ignore_index=True).sort_values("ingest_date")
-    else:
-        out = new_row
-    out.to_parquet(metrics_path, index=False)
-
-def append_hourly(hourly_path: str, hourly_df: pd.DataFrame) -> None:
-    os.makedirs(os.path.dirname(hourly_path), exist_ok=True)
-    if os.path.exists(hourly_path):
-        old = pd.read_parquet(hourly_path)
-        # idempotent for day
-        day = hourly_df["ingest_date"].iloc[0] if not hourly_df.empty else None
-        if day is not None:
-            old = old[old["ingest_date"] != day]
-        out = pd.concat([old, hourly_df], ignore_index=True)
-    else:
-        out = hourly_df
-    out.to_parquet(hourly_path, index=False)
-
-def process_day(data_dir: str, out_dir: str, ingest_date: str, chunksize_events: int | None = None) -> None:
+def upsert_daily_metrics(metrics_root: str, new_row: pd.DataFrame) -> None:
+    # one partition per ingest_date: overwriting it keeps reruns idempotent
+    # without reading or rewriting the other days
+    write_date_partition(new_row, metrics_root, new_row.loc[0, "ingest_date"])
+
+def append_hourly(hourly_root: str, hourly_df: pd.DataFrame) -> None:
+    # idempotent for day
+    if hourly_df.empty:
+        return
+    write_date_partition(hourly_df, hourly_root, hourly_df["ingest_date"].iloc[0])
+
+def build_day(data_dir: str, out_dir: str, ingest_date: str, chunksize_events: int | None = None) -> pd.DataFrame:
+    """
+    Everything for one day except alerts: clean/quarantine partitions, validation report,
+    hourly + daily metrics. Touches only that day's files, so days can run in parallel.
+    Returns the day's hourly events (input to write_alerts).
+    """
     customers_path, events_path, orders_path = load_day(data_dir, ingest_date)
     console.print(f"[bold]Processing {ingest_date}[/bold]")
 
     # Load raw
-    customers_raw = pd.read_csv(customers_path)
-    orders_raw = pd.read_csv(orders_path)
-
-    # Events can be large; allow chunksize
-    if chunksize_events:
-        events_iter = pd.read_csv(events_path, chunksize=chunksize_events)
-        events_raw = pd.concat(list(events_iter), ignore_index=True)
-    else:
-        events_raw = pd.read_csv(events_path)
+    customers_raw = read_csv(customers_path, kind="customers")
+    orders_raw = read_csv(orders_path, kind="orders")
 
     # Clean
     customers_cleaned = clean_customers(customers_raw, ingest_date)
-    events_cleaned = clean_events(events_raw, ingest_date)
+    # Events can be large; with chunksize they are cleaned chunk by chunk so the raw
+    # file is never fully materialized
+    if chunksize_events:
+        events_iter = read_csv(events_path, kind="events", chunksize=chunksize_events)
+        events_cleaned = clean_events_streaming(events_iter, ingest_date)
+    else:
+        events_cleaned = clean_events(read_csv(events_path, kind="events"), ingest_date)
     orders_cleaned = clean_orders(orders_raw, ingest_date)
 
     # Validate + quarantine
     customers_clean, customers_quarantine, cust_stats = split_clean_quarantine_customers(customers_cleaned)
-    events_clean, events_quarantine, ev_stats = split_clean_quarantine_events(events_cleaned, customers_clean)
-    orders_clean, orders_quarantine, ord_stats = split_clean_quarantine_orders(orders_cleaned, customers_clean)
+    customer_keys = customer_key_index(customers_clean)
+    events_clean, events_quarantine, ev_stats = split_clean_quarantine_events(
+        events_cleaned, customers_clean, customer_keys=customer_keys)
+    orders_clean, orders_quarantine, ord_stats = split_clean_quarantine_orders(
+        orders_cleaned, customers_clean, customer_keys=customer_keys)
 
     validation_report = {
         "ingest_date": ingest_date,
@@ -93,7 +96,7 @@ def process_day(data_dir: str, out_dir: str, ingest_date: str, chunksize_events:
     # Write outputs (overwrite partitions by date -> idempotent)
     def write_partition(kind: str, df: pd.DataFrame, root: str):
         part_dir = os.path.join(root, kind, f"ingest_date={ingest_date}")
-        os.makedirs(part_dir, exist_ok=True)
+        # (write_parquet creates part_dir)
         # simple single file; candidate may implement multiple parts
         write_parquet(df, os.path.join(part_dir, "part-00000.parquet"))
 
@@ -110,29 +113,40 @@ def process_day(data_dir: str, out_dir: str, ingest_date: str, chunksize_events:
     write_json(validation_report, os.path.join(reports_root, "validation_report.json"))
 
     # Metrics
-    # Ensure datetimes are datetime dtype (pandas may keep objects if all Nones)
-    if "event_time_utc" in events_clean.columns:
-        events_clean["event_time_utc"] = pd.to_datetime(events_clean["event_time_utc"], utc=True, errors="coerce")
-    if "order_time_utc" in orders_clean.columns:
-        orders_clean["order_time_utc"] = pd.to_datetime(orders_clean["order_time_utc"], utc=True, errors="coerce")
+    # Ensure datetimes are datetime dtype (pandas may keep objects if all Nones);
+    # the vectorized parsers already return datetime64[UTC], so normally nothing is rebuilt
+    for df, col in ((events_clean, "event_time_utc"), (orders_clean, "order_time_utc")):
+        if col in df.columns and not isinstance(df[col].dtype, pd.DatetimeTZDtype):
+            df[col] = pd.to_datetime(df[col], utc=True, errors="coerce")
 
     hourly = compute_hourly_events(events_clean)
-    append_hourly(os.path.join(out_dir, "metrics", "hourly_events.parquet"), hourly)
+    append_hourly(os.path.join(out_dir, "metrics", "hourly_events"), hourly)
 
     daily_row=compute_daily_metrics(ingest_date,customers_clean,customers_quarantine,events_clean,events_quarantine,orders_clean,orders_quarantine)
-    daily_metrics_path = os.path.join(out_dir, "metrics", "daily_metrics.parquet")
+    daily_metrics_path = os.path.join(out_dir, "metrics", "daily_metrics")
     upsert_daily_metrics(daily_metrics_path, daily_row)
 
-    # Alerts (uses history if present)
-    hist = None
-    if os.path.exists(daily_metrics_path):
-        hist = pd.read_parquet(daily_metrics_path)
-    alerts = detect_partial_load(ingest_date, hourly, hist)
-    write_json(alerts, os.path.join(reports_root, "alerts.json"))
-
     console.print(f"  customers clean/quarantine: {len(customers_clean)}/{len(customers_quarantine)}")
     console.print(f"  events    clean/quarantine: {len(events_clean)}/{len(events_quarantine)}")
     console.print(f"  orders    clean/quarantine: {len(orders_clean)}/{len(orders_quarantine)}")
+    return hourly
+
+def write_alerts(out_dir: str, ingest_date: str, hourly: pd.DataFrame) -> None:
+    # Alerts (uses history if present; only the columns/days the heuristics look at).
+    # The volume check compares against prior days, so their metrics must be written first.
+    daily_metrics_path = os.path.join(out_dir, "metrics", "daily_metrics")
+    hist = read_metrics_history(daily_metrics_path, until=ingest_date, columns=["ingest_date", "events_clean"])
+    alerts = detect_partial_load(ingest_date, hourly, hist)
+    reports_root = os.path.join("reports", f"ingest_date={ingest_date}")
+    write_json(alerts, os.path.join(reports_root, "alerts.json"))
+
+def process_day(data_dir: str, out_dir: str, ingest_date: str, chunksize_events: int | None = None) -> None:
+    hourly = build_day(data_dir, out_dir, ingest_date, chunksize_events)
+    write_alerts(out_dir, ingest_date, hourly)
+
+def _build_day_task(task: tuple) -> pd.DataFrame:
+    data_dir, out_dir, ingest_date, chunksize_events = task
+    return build_day(data_dir, out_dir, ingest_date, chunksize_events)
 
 def main():
     ap = argparse.ArgumentParser()
@@ -142,6 +156,8 @@ def main():
     ap.add_argument("--start", default=None)
     ap.add_argument("--end", default=None)
     ap.add_argument("--chunksize_events", type=int, default=None)
+    ap.add_argument("--workers", type=int, default=1,
+                    help="parallel processes across days (default: 1, all days in this process)")
     args = ap.parse_args()
 
     if args.date:
@@ -151,8 +167,24 @@ def main():
             raise SystemExit("Provide either --date or --start and --end")
         days = list(date_range(args.start, args.end))
 
-    for d in days:
-        process_day(args.data_dir, args.out_dir, d, chunksize_events=args.chunksize_events)
+    # out_dirs from before the partitioned metrics layout: move their single-file
+    # tables into partitions once, up front (days may write partitions concurrently)
+    for table in ("daily_metrics", "hourly_events"):
+        migrate_single_file_dataset(os.path.join(args.out_dir, "metrics", table))
+
+    workers = args.workers
+    if workers <= 1 or len(days) == 1:
+        for d in days:
+            process_day(args.data_dir, args.out_dir, d, chunksize_events=args.chunksize_events)
+        return
+
+    # days only share the metrics history read by alerting: build all days across
+    # processes, then run the alerts in date order once every day's metrics exist
+    tasks = [(args.data_dir, args.out_dir, d, args.chunksize_events) for d in days]
+    with mp.Pool(processes=min(workers, len(tasks))) as pool:
+        hourly_by_day = pool.map(_build_day_task, tasks)
+    for d, hourly in zip(days, hourly_by_day):
+        write_alerts(args.out_dir, d, hourly)
 
 if __name__ == "__main__":
     main()
@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 import re
+import numpy as np
 import pandas as pd
 from datetime import datetime, timezone
 from dateutil import parser
 from difflib import SequenceMatcher
 
+# Accepted timestamp years (computed once per process, not per parsed value)
+MIN_YEAR = 1900
+MAX_YEAR = datetime.now(timezone.utc).year + 1
+
 CANON_CURRENCY = {
     "usd": "USD",
     "$": "USD",
@@ -53,10 +58,11 @@ CANON_ORDER_STATUS = {
     "chargeback": "chargeback",
 }
 
-#Regex
+#Regex (compiled once; the *_series helpers hand these to pandas' .str methods)
 EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 CUSTOMER_ID_RE = re.compile(r"^c\d{5}$")
 CUSTOMER_ID_EMBEDDED_RE = re.compile(r"(c\d{5})", re.IGNORECASE)
+ISO_DATETIME_PATTERN = r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]+)?(?:Z|[+-][0-9]{2}(?::?[0-9]{2})?)?"
 
 def is_valid_email(email: str | None) -> bool:
     if not email or not isinstance(email, str):
@@ -169,13 +175,6 @@ def parse_timestamp_to_utc(value: str | None) -> datetime | None:
     if isinstance(value, float) and value != value:  # NaN
         return None
 
-    current_year = datetime.now(timezone.utc).year
-    min_year = 1900
-    max_year = current_year + 1
-
-    def year_valid(dt: datetime) -> bool:
-        return min_year <= dt.year <= max_year
-
     s = str(value).strip()
     if not s:
         return None
@@ -186,7 +185,7 @@ def parse_timestamp_to_utc(value: str | None) -> datetime | None:
         if len(s) == 8:
             try:
                 dt = datetime.strptime(s, "%Y%m%d").replace(tzinfo=timezone.utc)
-                return dt if year_valid(dt) else None
+                return dt if MIN_YEAR <= dt.year <= MAX_YEAR else None
             except Exception:
                 return None
 
@@ -206,7 +205,7 @@ def parse_timestamp_to_utc(value: str | None) -> datetime | None:
                 ts = float(ts_int)
 
             dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-            return dt if year_valid(dt) else None
+            return dt if MIN_YEAR <= dt.year <= MAX_YEAR else None
         except Exception:
             return None
 
@@ -219,7 +218,7 @@ def parse_timestamp_to_utc(value: str | None) -> datetime | None:
             dt = dt.replace(tzinfo=timezone.utc)
 
         dt = dt.astimezone(timezone.utc)
-        return dt if year_valid(dt) else None
+        return dt if MIN_YEAR <= dt.year <= MAX_YEAR else None
     except Exception:
         return None
 
@@ -235,3 +234,128 @@ def safe_float(x) -> float | None:
         return v
     except Exception:
         return None
+
+
+# Vectorized (column-level) normalizers.
+# Same semantics as the scalar helpers above, but run over a whole Series so the
+# cleaning step doesn't pay a Python function call per row.
+
+def _text(series: pd.Series) -> pd.Series:
+    """Nullable string view of a column (NaN/None -> <NA>, numbers -> str)."""
+    return series.astype("string")
+
+def map_unique(series: pd.Series, func) -> pd.Series:
+    """
+    Apply a scalar helper once per distinct value and broadcast the results back.
+
+    For the row paths that can't be vectorized (free-form timestamp fallback, fuzzy
+    matching): messy columns repeat the same few spellings, so this turns N Python
+    calls into n_unique calls. Missing values get func(None).
+    """
+    codes, uniques = pd.factorize(series)
+    results = np.empty(len(uniques) + 1, dtype=object)
+    results[:-1] = [func(u) for u in uniques]
+    results[-1] = func(None)  # factorize codes missing values as -1 -> last slot
+    return pd.Series(results[codes], index=series.index, dtype=object)
+
+def is_valid_email_series(series: pd.Series) -> pd.Series:
+    return _text(series).str.strip().str.match(EMAIL_RE, na=False).astype(bool)
+
+def normalize_currency_series(series: pd.Series) -> pd.Series:
+    s = _text(series).str.strip().str.lower().str.replace(" ", "", regex=False)
+    return s.map(CANON_CURRENCY)
+
+def normalize_platform_series(series: pd.Series) -> pd.Series:
+    return _text(series).str.strip().str.lower().map(CANON_PLATFORM)
+
+def normalize_country_series(series: pd.Series) -> pd.Series:
+    return _text(series).str.strip().str.upper().map(CANON_COUNTRY)
+
+def normalize_customer_status_series(series: pd.Series, threshold: float = 0.80) -> pd.Series:
+    s = _text(series).str.strip().str.lower()
+    known = s.isin(CANON_STATUS_CUSTOMER)
+    out = s.where(known)
+    # only the typos need fuzzy matching, once per distinct spelling
+    residual = s[~known & s.notna()].unique()
+    if len(residual):
+        lookup = {v: normalize_customer_status(v, threshold) for v in residual}
+        out = out.fillna(s.map(lookup))
+    return out
+
+def normalize_order_status_series(series: pd.Series) -> pd.Series:
+    return _text(series).str.strip().str.lower().map(CANON_ORDER_STATUS)
+
+def normalize_customer_id_series(series: pd.Series) -> pd.Series:
+    # an exact "c12345" is its own first embedded match, so one extract covers both cases
+    s = _text(series).str.strip().str.lower()
+    return s.str.extract(CUSTOMER_ID_EMBEDDED_RE, expand=False)
+
+def safe_float_series(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(series, errors="coerce").astype("float64")
+
+def _epoch_seconds(year: int) -> int:
+    """Epoch seconds at Jan 1 of `year` (UTC)."""
+    return int(datetime(year, 1, 1, tzinfo=timezone.utc).timestamp())
+
+def parse_timestamp_to_utc_series(series: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_timestamp_to_utc -> datetime64[UTC] Series (NaT when invalid).
+
+    C-level passes cover the common shapes:
+      1) the dominant "YYYY-MM-DD HH:MM:SS" layout
+      2) full ISO8601 date-times with/without offset (partial dates go to the scalar parser)
+      3) digit-only values: YYYYMMDD codes (8 digits), epoch s/ms (10+ digits);
+         any other length is ambiguous and rejected
+    Whatever is still unparsed (free-form strings) goes through the scalar parser once
+    per distinct value, so the accepted formats and year bounds stay identical.
+    """
+    # positional index for the partial assignments below; the caller's index may
+    # repeat labels and is restored on return
+    index = series.index
+    s = _text(series).reset_index(drop=True).str.strip()
+    s = s.mask(s == "")
+
+    # leading years outside MIN_YEAR..MAX_YEAR can overflow datetime64[ns]; keep them out of
+    # the C passes (the scalar parser rejects them, as it always did)
+    has_year = s.str.match(r"[0-9]{4}").fillna(False).astype(bool)
+    lead_year = pd.to_numeric(s.str.slice(0, 4).where(has_year), errors="coerce")
+    dated = s.where(lead_year.between(MIN_YEAR, MAX_YEAR))
+
+    # fixed ns unit: pandas 3 infers seconds here, which can't hold fractional ISO values
+    out = pd.to_datetime(dated, format="%Y-%m-%d %H:%M:%S", errors="coerce", utc=True).astype("datetime64[ns, UTC]")
+
+    # ASCII digits only; other Unicode "digits" are left to the scalar parser
+    is_digits = s.str.fullmatch(r"[0-9]+").fillna(False).astype(bool)
+    # ISO8601 only for full date-times; partial dates ("2025-01") are filled in
+    # differently by dateutil, so they stay on the scalar path
+    is_iso = dated.str.fullmatch(ISO_DATETIME_PATTERN).fillna(False).astype(bool)
+    rest = out.isna() & is_iso
+    if rest.any():
+        out.loc[rest] = pd.to_datetime(dated[rest], format="ISO8601", errors="coerce", utc=True)
+
+    if is_digits.any():
+        digits = s[is_digits]
+        n = digits.str.len()
+        # YYYYMMDD years past MAX_YEAR can overflow datetime64[ns]; bound them first
+        code = (n == 8) & digits.str.slice(0, 4).astype("int64").between(MIN_YEAR, MAX_YEAR)
+        if code.any():
+            out.loc[code[code].index] = pd.to_datetime(digits[code], format="%Y%m%d", errors="coerce", utc=True)
+        epoch = n >= 10
+        if epoch.any():
+            # epoch ms if very large, else seconds; bound-check in integer seconds first
+            # (values past MAX_YEAR would overflow datetime64) -- 19+ digits can't be valid
+            values = digits[epoch & (n <= 18)]
+            ts = values.astype("int64").to_numpy()
+            ms = ts >= 1_000_000_000_000
+            ok = np.where(ms, ts // 1000, ts) < _epoch_seconds(MAX_YEAR + 1)
+            ns = np.where(ms[ok], ts[ok] * 1_000_000, ts[ok] * 1_000_000_000)
+            out.loc[values.index[ok]] = pd.to_datetime(ns, unit="ns", utc=True)
+
+    rest = out.isna() & s.notna() & ~is_digits
+    if rest.any():
+        out.loc[rest] = pd.to_datetime(map_unique(s[rest], parse_timestamp_to_utc), errors="coerce", utc=True)
+
+    years = out.dt.year
+    out = out.where(years.between(MIN_YEAR, MAX_YEAR))
+    out.index = index
+    return out
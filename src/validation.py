@@ -1,21 +1,244 @@
 \
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-import re
-from datetime import datetime, timezone
-from typing import Optional, Tuple
+import pyarrow as pa
+import pyarrow.compute as pc
+from typing import Optional, Tuple, TypedDict
+
+from .utils import MAX_YEAR, MIN_YEAR
+
+# Arrow-backed strings: strip/lower/match/isin run as Arrow compute kernels. This is
+# already the "string" default on pandas 3, but not on pandas 2.x (python storage).
+# pyarrow is a hard requirement (requirements.txt), so there is no python-storage
+# fallback. Regexes on these columns go to Arrow (RE2) as pattern strings: pandas 2.x
+# rejects compiled re.Pattern objects there.
+TEXT_DTYPE = "string[pyarrow]"
+
+# "", "nan", "none", "null" in any case (applied to stripped text)
+MISSING_TEXT_PATTERN = r"(?i:nan|none|null)?"
+
+# customer_id format: c + 5 digits (matched case-insensitively)
+CUSTOMER_ID_PATTERN = r"^c\d{5}$"
+
+class ValidatorStats(TypedDict):
+    """Stats returned by every split_clean_quarantine_* (and written to validation_report.json)."""
+    total: int
+    clean: int
+    quarantine: int
+    by_reason: dict[str, int]
+    duplicates: dict[str, int]
+
+def by_category(series: pd.Series, rule, null_hit) -> np.ndarray:
+    """
+    Evaluate a text rule (Series -> bool mask, or a list of masks) once per category
+    of a categorical column and gather the answer through the integer codes; null
+    rows (code -1) get null_hit. Non-categorical columns run the rule as is.
+
+    Casting a categorical to Arrow text materializes every row through Python
+    objects, which costs far more than the rule on the few distinct values.
+    """
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return np.asarray(rule(series), dtype=bool)
+    hits = np.asarray(rule(pd.Series(series.cat.categories)), dtype=bool)
+    null = np.broadcast_to(np.asarray(null_hit, dtype=bool)[..., None], hits.shape[:-1] + (1,))
+    return np.concatenate([hits, null], axis=-1)[..., series.cat.codes.to_numpy()]
+
+def is_missing_text(series: pd.Series) -> np.ndarray:
+    return by_category(series, lambda s: _missing_text_from_stripped(s.astype(TEXT_DTYPE).str.strip()), True)
+
+def _missing_text_from_stripped(s: pd.Series) -> pd.Series:
+    # is_missing_text for a column the caller already cast + stripped (and reuses).
+    # One case-insensitive fullmatch covers "", nan/none/null (no lowercased copy of
+    # the column); nulls come back NA from the match and count as missing.
+    return s.str.fullmatch(MISSING_TEXT_PATTERN).fillna(True).astype(bool)
+
+def ingest_date_mismatch(series: pd.Series, ingest_date: str) -> np.ndarray:
+    """
+    True where the stripped value isn't ingest_date (null / empty included).
+
+    A single compare against the constant: nulls come back NA and are filled as
+    mismatches, and "" can never equal a real partition date.
+    """
+    def mismatch(s: pd.Series) -> pd.Series:
+        return (s.astype(TEXT_DTYPE).str.strip() != str(ingest_date)).fillna(True).astype(bool)
+    return by_category(series, mismatch, True)
 
+def _check_where(need: pd.Series, check) -> pd.Series:
+    """
+    Boolean rule mask that runs check(rows) only on the rows where `need` holds
+    (False elsewhere), for rules that depend on an earlier one (format / orphan
+    checks only apply once the id is present), so regex / hash lookups skip the
+    rows an earlier rule already settled.
+    """
+    rows = np.asarray(need, dtype=bool)
+    out = np.zeros(len(rows), dtype=bool)
+    if rows.any():
+        out[rows] = np.asarray(check(rows), dtype=bool)
+    return pd.Series(out, index=need.index)
 
-def is_missing_text(series: pd.Series) -> pd.Series:
-    s = series.astype("string").str.strip()
-    return s.isna() | (s == "") | s.str.lower().isin(["nan", "none", "null"])
+def customer_key_index(customers_clean: Optional[pd.DataFrame]) -> pd.Index:
+    """
+    Stripped customer ids of customers_clean as a hashed Index for .isin (empty if
+    there is no customer_id column), so orphan checks stay in pandas' C hash table.
+    """
+    if customers_clean is None or "customer_id" not in customers_clean.columns:
+        return pd.Index([], dtype=TEXT_DTYPE)
+    return pd.Index(customers_clean["customer_id"].astype(TEXT_DTYPE).str.strip().dropna().unique())
 
+def isin_values(series: pd.Series, values) -> np.ndarray:
+    """
+    series.isin(values) as numpy bools. For a categorical column the few categories
+    are looked up once and the result is gathered through the integer codes (code -1,
+    a null, never matches).
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        known = np.append(series.cat.categories.isin(list(values)), False)
+        return known[series.cat.codes.to_numpy()]
+    return series.isin(values).to_numpy(dtype=bool)
+
+def isin_keys(series: pd.Series, keys: pd.Index) -> np.ndarray:
+    """
+    series.isin(keys) for text, as a single Arrow hashed is_in (nulls never match).
+
+    pandas' isin on Arrow strings first boxes every key into a Python scalar, which
+    costs more than the lookup itself once the key set is the whole customer table.
+    """
+    values = pa.array(series.astype(TEXT_DTYPE))
+    value_set = pa.array(keys.astype(TEXT_DTYPE))
+    return pc.is_in(values, value_set=value_set).to_numpy(zero_copy_only=False)
+
+def count_full_row_duplicates(df: pd.DataFrame, key_dupes: np.ndarray) -> int:
+    """
+    Rows involved in exact full-row duplicates (df.duplicated(keep=False).sum()).
+    Identical rows share their key, so only the rows flagged in key_dupes (the key
+    column's duplicated(keep=False), which the id-duplicate stat reuses) are hashed
+    across all columns.
+    """
+    if not key_dupes.any():
+        return 0
+    return int(df[key_dupes].duplicated(keep=False).sum())
 
+def reason_counts(quarantine: pd.DataFrame) -> dict:
+    """
+    stats["by_reason"]: rows per reject_reason. A healthy day usually quarantines
+    nothing, and then {} is returned without building a value_counts.
+    """
+    if quarantine.empty:
+        return {}
+    return quarantine["reject_reason"].value_counts(dropna=True).to_dict()
+
+# rows per Arrow chunk of reject_reason (labels joined stay far below 2 GiB per chunk)
+REASON_TAKE_ROWS = 1 << 20
+
+def join_reasons(
+    rules: list[tuple[pd.Series | np.ndarray, str]],
+    index: pd.Index,
+    return_counts: bool = False,
+) -> pd.Series | tuple[pd.Series, dict]:
+    """
+    "|"-joined labels of the rules each row fails, in rule order (NA if it passes all),
+    as an Arrow-backed TEXT_DTYPE Series.
+
+    Rule hits are packed into one integer per row (bit i = rule i), and a string is
+    built once per distinct failure pattern. The codes use the narrowest unsigned
+    dtype that holds every bit and are OR-ed in place through one reused shift
+    buffer, so packing allocates no per-rule temporaries. The rows then take their pattern's string straight
+    into one Arrow buffer (null index = clean row): no Python str per row.
+
+    With return_counts, also returns stats["by_reason"] (rows per reason, most
+    frequent first, like value_counts) tallied from the pattern codes with a
+    bincount instead of hashing the reason strings again.
+    """
+    take = np.full(len(index), -1, dtype=np.intp)
+    strings = []
+    by_reason = {}
+    if rules:
+        labels = [label for _, label in rules]
+        code_dtype = np.min_scalar_type((1 << len(labels)) - 1)
+        codes = np.zeros(len(index), dtype=code_dtype)
+        shifted = np.empty_like(codes)
+        for bit, (mask, _) in enumerate(rules):
+            # the shift is computed in code_dtype explicitly: under NumPy 1.x value-based
+            # casting a uint8 << scalar stays uint8 and drops every bit >= 8
+            hits = np.asarray(mask, dtype=bool).view(np.uint8)
+            np.left_shift(hits, bit, out=shifted, dtype=code_dtype)
+            np.bitwise_or(codes, shifted, out=codes)
+        bad = np.flatnonzero(codes)
+        patterns, first, inverse = np.unique(codes[bad], return_index=True, return_inverse=True)
+        strings = ["|".join([l for bit, l in enumerate(labels) if int(p) >> bit & 1]) for p in patterns]
+        take[bad] = inverse
+        if return_counts:
+            counts = np.bincount(inverse, minlength=len(patterns))
+            # value_counts order: descending count, ties in order of first appearance
+            by_first = np.argsort(first, kind="stable")
+            order = by_first[np.argsort(-counts[by_first], kind="stable")]
+            by_reason = {strings[k]: int(counts[k]) for k in order}
+    # pa.string(): pandas 2.1's ArrowStringArray only accepts 32-bit offsets, so the
+    # take runs per slice of rows and no chunk can outgrow them
+    indices = pa.array(take, mask=take < 0)
+    slices = [indices.slice(start, REASON_TAKE_ROWS) for start in range(0, len(indices), REASON_TAKE_ROWS)]
+    values = pc.take(pa.array(strings, type=pa.string()), pa.chunked_array(slices, type=indices.type))
+    reject_reason = pd.Series(pd.arrays.ArrowStringArray(values), index=index)
+    if return_counts:
+        return reject_reason, by_reason
+    return reject_reason
+
+
+
+def apply_rules(
+    df: pd.DataFrame,
+    rules: list[tuple[pd.Series | np.ndarray, str]],
+    duplicates: dict[str, int],
+) -> Tuple[pd.DataFrame, pd.DataFrame, ValidatorStats]:
+    """
+    Shared tail of the split_clean_quarantine_* validators: join the (mask, label)
+    rules into reject_reason, split df on it and build the stats.
+
+    df is only read: reject_reason is attached to the quarantine slice alone. An
+    empty df (e.g. an empty streaming batch) comes straight back with zero stats.
+    """
+    if df.empty:
+        quarantine = df.assign(reject_reason=pd.Series(index=df.index, dtype=TEXT_DTYPE))
+        stats: ValidatorStats = {"total": 0, "clean": 0, "quarantine": 0, "by_reason": {}, "duplicates": duplicates}
+        return df, quarantine, stats
+
+    reject_reason, by_reason = join_reasons(rules, df.index, return_counts=True)
+
+    rejected = reject_reason.notna()
+    quarantine = df[rejected].assign(reject_reason=reject_reason[rejected])
+    clean = df[~rejected]
+
+    stats: ValidatorStats = {
+        "total": int(len(df)),
+        "clean": int(len(clean)),
+        "quarantine": int(len(quarantine)),
+        "by_reason": by_reason,
+        "duplicates": duplicates,
+    }
+    return clean, quarantine, stats
+
+def quarantine_all(
+    df: pd.DataFrame,
+    missing_required: list[str],
+    duplicates: dict[str, int],
+) -> Tuple[pd.DataFrame, pd.DataFrame, ValidatorStats]:
+    """Every row rejected: required columns are missing from the frame itself."""
+    quarantine = df.assign(reject_reason="missing_required_columns:" + ",".join(missing_required))
+    clean = quarantine.iloc[0:0]  # empty
+    stats: ValidatorStats = {
+        "total": int(len(df)),
+        "clean": 0,
+        "quarantine": int(len(df)),
+        "by_reason": reason_counts(quarantine),
+        "duplicates": duplicates,
+    }
+    return clean, quarantine, stats
 
 def split_clean_quarantine_customers(
     df: pd.DataFrame,
-    ingest_date: Optional[str] = None ) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
+    ingest_date: Optional[str] = None ) -> Tuple[pd.DataFrame, pd.DataFrame, ValidatorStats]:
     """
     Validate customers and split into clean + quarantine with reject reasons.
 
@@ -31,91 +254,86 @@ def split_clean_quarantine_customers(
       - Quarantine rows keep reject_reason
       - Clean rows do NOT include reject_reason
     """
-    df = df.copy()
+    # df is only read: reject_reason is built as its own Series and attached to the
+    # quarantine slice alone, so the caller's frame needs no defensive copy
 
     def year_out_of_range(dt_series: pd.Series) -> pd.Series:
-        max_year = datetime.now(timezone.utc).year + 1
-        years = pd.to_datetime(dt_series, errors="coerce", utc=True).dt.year
-        return years.notna() & ((years < 1900) | (years > max_year))
+        # created_at_utc is normally datetime64 already; only parse other inputs
+        if not pd.api.types.is_datetime64_any_dtype(dt_series):
+            dt_series = pd.to_datetime(dt_series, errors="coerce", utc=True)
+        # compare the raw datetime64 values (UTC instants) against the year bounds
+        # directly instead of extracting years; NaT compares False on both sides
+        values = dt_series.values
+        low, high = np.datetime64(f"{MIN_YEAR}-01-01"), np.datetime64(f"{MAX_YEAR + 1}-01-01")
+        return pd.Series((values < low) | (values >= high), index=dt_series.index)
 
-    # customer_id format: c + 5 digits
-    CUSTOMER_ID_RE = re.compile(r"^c\d{5}$", re.IGNORECASE)
+    if df.empty:
+        return apply_rules(df, [], {"full_row_dupes_rows_involved": 0, "customer_id_dupes_rows_involved": 0})
 
-    # Build reject reasons
-    reject_reason = pd.Series("", index=df.index, dtype="string")
+    # Build reject reasons: (mask, label) per rule, joined once at the end
+    rules = []
 
     # customer_id required + format
-    missing_customer_id = is_missing_text(df["customer_id"])
-    reject_reason.loc[missing_customer_id] += "|missing_customer_id"
+    cust_str = df["customer_id"].astype(TEXT_DTYPE).str.strip()
+    missing_customer_id = _missing_text_from_stripped(cust_str)
+    rules.append((missing_customer_id, "missing_customer_id"))
 
-    cust_str = df["customer_id"].astype("string").str.strip()
-    invalid_customer_id = (~missing_customer_id) & (~cust_str.fillna("").str.match(CUSTOMER_ID_RE))
-    reject_reason.loc[invalid_customer_id] += "|invalid_customer_id"
+    invalid_customer_id = _check_where(~missing_customer_id, lambda rows: ~cust_str[rows].str.match(CUSTOMER_ID_PATTERN, case=False))
+    rules.append((invalid_customer_id, "invalid_customer_id"))
 
     # created_at required + year sanity
     missing_created_at = df["created_at_utc"].isna()
-    reject_reason.loc[missing_created_at] += "|missing_created_at"
+    rules.append((missing_created_at, "missing_created_at"))
 
     created_at_out_of_range = year_out_of_range(df["created_at_utc"])
-    reject_reason.loc[created_at_out_of_range] += "|created_at_out_of_range"
+    rules.append((created_at_out_of_range, "created_at_out_of_range"))
 
     # email required + valid
     missing_email = is_missing_text(df["email"])
-    reject_reason.loc[missing_email] += "|missing_email"
+    rules.append((missing_email, "missing_email"))
 
-    invalid_email = (~missing_email) & (~df["email_valid"].fillna(False))
-    reject_reason.loc[invalid_email] += "|invalid_email"
+    # clean_customers stores email_valid as numpy bool; other inputs (nullable / object)
+    # are flattened once, NA counting as not valid
+    email_ok = df["email_valid"].to_numpy(dtype=bool, na_value=False)
+    invalid_email = ~missing_email & ~email_ok
+    rules.append((invalid_email, "invalid_email"))
 
     # status allowed
     allowed_status = {"active", "inactive", "banned"}
-    invalid_status = df["status"].isna() | (~df["status"].isin(allowed_status))
-    reject_reason.loc[invalid_status] += "|invalid_status"
+    invalid_status = ~isin_values(df["status"], allowed_status)  # null is never allowed
+    rules.append((invalid_status, "invalid_status"))
 
     # country must exist after normalization
     invalid_country = df["country"].isna()
-    reject_reason.loc[invalid_country] += "|invalid_country"
+    rules.append((invalid_country, "invalid_country"))
 
     if "ingest_date" in df.columns:
         missing_ingest_date = is_missing_text(df["ingest_date"])
-        reject_reason.loc[missing_ingest_date] += "|missing_ingest_date"
+        rules.append((missing_ingest_date, "missing_ingest_date"))
 
         if ingest_date is not None:
-            raw_ing = df["ingest_date"].astype("string").str.strip()
-            ingest_mismatch = (~missing_ingest_date) & (raw_ing != ingest_date)
-            reject_reason.loc[ingest_mismatch] += "|ingest_date_mismatch"
+            ingest_mismatch = ~missing_ingest_date & ingest_date_mismatch(df["ingest_date"], ingest_date)
+            rules.append((ingest_mismatch, "ingest_date_mismatch"))
 
-    # finalize reject_reason column
-    reject_reason = reject_reason.str.lstrip("|")
-    df["reject_reason"] = reject_reason.replace({"": pd.NA})
-
-    # Split clean vs quarantine
-    quarantine = df[df["reject_reason"].notna()].copy()
-    clean = df[df["reject_reason"].isna()].drop(columns=["reject_reason"]).copy()
-    
     # Stats / reporting
-    full_row_dupes_rows_involved = int(df.duplicated(keep=False).sum())
+    # one hash pass over customer_id serves both duplicate stats: equal raw ids are
+    # equally missing or not, so duplicates among present ids are these rows too
+    id_dupes = df["customer_id"].duplicated(keep=False).to_numpy()
+    full_row_dupes_rows_involved = count_full_row_duplicates(df, id_dupes)
 
     # duplicates by customer_id
-    non_missing = df[~missing_customer_id]
-    customer_id_dupes_rows_involved = int(non_missing.duplicated(subset=["customer_id"], keep=False).sum())
+    customer_id_dupes_rows_involved = int((id_dupes & ~missing_customer_id.to_numpy()).sum())
 
-    stats = {
-        "total": int(len(df)),
-        "clean": int(len(clean)),
-        "quarantine": int(len(quarantine)),
-        "by_reason": quarantine["reject_reason"].value_counts(dropna=True).to_dict(),
-        "duplicates": {
-            "full_row_dupes_rows_involved": full_row_dupes_rows_involved,
-            "customer_id_dupes_rows_involved": customer_id_dupes_rows_involved,
-        },
-    }
-
-    return clean, quarantine, stats
+    return apply_rules(df, rules, {
+        "full_row_dupes_rows_involved": full_row_dupes_rows_involved,
+        "customer_id_dupes_rows_involved": customer_id_dupes_rows_involved,
+    })
 
 def split_clean_quarantine_events(
     df: pd.DataFrame,
     customers_clean: pd.DataFrame,
-    ingest_date: Optional[str] = None) -> tuple[pd.DataFrame, pd.DataFrame, dict]:
+    ingest_date: Optional[str] = None,
+    customer_keys: Optional[pd.Index] = None) -> Tuple[pd.DataFrame, pd.DataFrame, ValidatorStats]:
     """
     Returns (clean_df, quarantine_df, stats).
 
@@ -126,111 +344,87 @@ def split_clean_quarantine_events(
       - referential integrity: customer_id must exist in customers_clean.customer_id
       - ingest_date matches provided ingest_date
       - duplicates detected (full-row + event_id based) are reported in stats
-    """
-    df = df.copy()
 
+    customer_keys: customer_key_index(customers_clean), if the caller already built it
+    (the pipeline shares one across the events and orders validators).
+    """
     # required columns present
     required_cols = ["event_id", "customer_id", "event_time_utc", "event_type", "platform"]
     missing_required = [c for c in required_cols if c not in df.columns]
     if missing_required:
         # if required cols are missing from the dataframe itself, everything is invalid
-        df["reject_reason"] = "missing_required_columns:" + ",".join(missing_required)
-        quarantine = df.copy()
-        clean = df.iloc[0:0].copy()  # empty
-        stats = {
-            "total": int(len(df)),
-            "clean": 0,
-            "quarantine": int(len(df)),
-            "by_reason": quarantine["reject_reason"].value_counts(dropna=True).to_dict(),
-            "duplicates": {"full_row": 0, "event_id": 0},
-        }
-        return clean, quarantine, stats
-
-    reason = pd.Series("", index=df.index, dtype="object")
+        return quarantine_all(df, missing_required, {"full_row": 0, "event_id": 0})
+    if df.empty:
+        return apply_rules(df, [], {"full_row": 0, "event_id": 0})
+
+    rules = []
+
+    # ids are cast + stripped once and shared by the missing/orphan/duplicate checks
+    event_id_s = df["event_id"].astype(TEXT_DTYPE).str.strip()
+    customer_id_s = df["customer_id"].astype(TEXT_DTYPE).str.strip()
 
     # event_id missing
-    bad_event_id = is_missing_text(df["event_id"])
-    reason[bad_event_id] += "|missing_event_id"
+    bad_event_id = _missing_text_from_stripped(event_id_s)
+    rules.append((bad_event_id, "missing_event_id"))
 
     # customer_id missing
-    bad_customer = is_missing_text(df["customer_id"])
-    reason[bad_customer] += "|missing_customer_id"
+    bad_customer = _missing_text_from_stripped(customer_id_s)
+    rules.append((bad_customer, "missing_customer_id"))
 
     # event_type missing
     bad_event_type = is_missing_text(df["event_type"])
-    reason[bad_event_type] += "|missing_event_type"
+    rules.append((bad_event_type, "missing_event_type"))
 
     # platform missing (after your normalize_platform, unknowns should become None/NaN)
     bad_platform = df["platform"].isna()
-    reason[bad_platform] += "|missing_platform"
+    rules.append((bad_platform, "missing_platform"))
 
     # timestamp invalid
     invalid_ts = df["event_time_utc"].isna()
-    reason[invalid_ts] += "|invalid_event_time"
+    rules.append((invalid_ts, "invalid_event_time"))
     
     # duration_ms >= 0 and <= 24 hours
     if "duration_ms" in df.columns:
-        dur = pd.to_numeric(df["duration_ms"], errors="coerce")
+        # plain float64 values: NaN (unparseable / missing) compares False both ways
+        dur = pd.to_numeric(df["duration_ms"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
 
-        negative_dur = dur.notna() & (dur < 0)
-        reason[negative_dur] += "|negative_duration"
+        negative_dur = dur < 0
+        rules.append((negative_dur, "negative_duration"))
 
         max_duration_ms = 24 * 60 * 60 * 1000  # 24 hours
-        too_large_dur = dur.notna() & (dur > max_duration_ms)
-        reason[too_large_dur] += "|duration_exceeds_max"
+        too_large_dur = dur > max_duration_ms
+        rules.append((too_large_dur, "duration_exceeds_max"))
 
     # referential integrity
     # only check orphans when customer_id is present
-    customer_set = set(
-        customers_clean["customer_id"].astype("string").str.strip()
-    ) if (customers_clean is not None and "customer_id" in customers_clean.columns) else set()
+    if customer_keys is None:
+        customer_keys = customer_key_index(customers_clean)
 
-    has_customer = ~bad_customer
-    orphan = has_customer & ~df["customer_id"].astype("string").str.strip().isin(customer_set)
-    reason[orphan] += "|orphan_customer_id"
+    orphan = _check_where(~bad_customer, lambda rows: ~isin_keys(customer_id_s[rows], customer_keys))
+    rules.append((orphan, "orphan_customer_id"))
 
     # ingest_date matches partition date
     if ingest_date is not None and "ingest_date" in df.columns:
-        df_ing = df["ingest_date"].astype("string").str.strip()
-        bad_ingest = df_ing.isna() | (df_ing == "") | (df_ing != str(ingest_date))
-        reason[bad_ingest] += "|ingest_date_mismatch"
+        bad_ingest = ingest_date_mismatch(df["ingest_date"], ingest_date)
+        rules.append((bad_ingest, "ingest_date_mismatch"))
     
-    # finalize reject_reason column
-    
-    reason = reason.str.strip("|")
-    df["reject_reason"] = reason.replace({"": None})
-
-    quarantine = df[df["reject_reason"].notna()].copy()
-    clean = df[df["reject_reason"].isna()].drop(columns=["reject_reason"]).copy()
-
     # stats
     # full-row duplicates in the ORIGINAL df (before split)
-    full_row_dup_count = int(df.duplicated(keep=False).sum())
+    # (one hash pass over event_id serves both duplicate stats, as for customers)
+    id_dupes = df["event_id"].duplicated(keep=False).to_numpy()
+    full_row_dup_count = count_full_row_duplicates(df, id_dupes)
 
     # event_id duplicates
-    event_id_dup_count = 0
-    if "event_id" in df.columns:
-        s = df["event_id"].astype("string").str.strip()
-        valid_event_id = s.notna() & (s != "")
-        event_id_dup_count = int(df.loc[valid_event_id, "event_id"].duplicated(keep=False).sum())
+    valid_event_id = (event_id_s != "").fillna(False).to_numpy(dtype=bool)
+    event_id_dup_count = int((id_dupes & valid_event_id).sum())
 
-    stats = {
-        "total": int(len(df)),
-        "calen": int(len(clean)),
-        "quarantine": int(len(quarantine)),
-        "by_reason": quarantine["reject_reason"].value_counts(dropna=True).to_dict(),
-        "duplicates": {
-            "full_row": full_row_dup_count,
-            "event_id": event_id_dup_count,
-        },
-    }
-
-    return clean, quarantine, stats
+    return apply_rules(df, rules, {"full_row": full_row_dup_count, "event_id": event_id_dup_count})
 
 def split_clean_quarantine_orders(
     df: pd.DataFrame,
     customers_clean: pd.DataFrame,
-    ingest_date: Optional[str] = None ) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
+    ingest_date: Optional[str] = None,
+    customer_keys: Optional[pd.Index] = None) -> Tuple[pd.DataFrame, pd.DataFrame, ValidatorStats]:
     """
     Returns (clean_df, quarantine_df, stats).
 
@@ -241,120 +435,103 @@ def split_clean_quarantine_orders(
       - amount numeric (not null) and not negative
       - referential integrity: customer_id must exist in customers_clean.customer_id
       - ingest_date matches provided ingest_date
-    """
-    df = df.copy()
 
+    customer_keys: customer_key_index(customers_clean), if the caller already built it
+    (the pipeline shares one across the events and orders validators).
+    """
     # required columns present
     required_cols = ["order_id", "customer_id", "order_time_utc", "amount", "currency", "status"]
     missing_required = [c for c in required_cols if c not in df.columns]
     if missing_required:
-        df["reject_reason"] = "missing_required_columns:" + ",".join(missing_required)
-        quarantine = df.copy()
-        clean = df.iloc[0:0].copy()
-        stats = {
-            "total": int(len(df)),
-            "clean": 0,
-            "quarantine": int(len(df)),
-            "by_reason": quarantine["reject_reason"].value_counts(dropna=True).to_dict(),
-            "duplicates": {"full_row": 0, "order_id": 0},
-        }
-        return clean, quarantine, stats
-
-    reason = pd.Series("", index=df.index, dtype="object")
+        return quarantine_all(df, missing_required, {"full_row": 0, "order_id": 0})
+    if df.empty:
+        return apply_rules(df, [], {"full_row": 0, "order_id": 0})
+
+    rules = []
 
     
     # basic validity checks
    
+    # ids are cast + stripped once and shared by the missing/orphan/duplicate checks
+    order_id_s = df["order_id"].astype(TEXT_DTYPE).str.strip()
+    customer_id_s = df["customer_id"].astype(TEXT_DTYPE).str.strip()
+
     # order_id missing
-    bad_order_id = is_missing_text(df["order_id"])
-    reason[bad_order_id] += "|missing_order_id"
+    bad_order_id = _missing_text_from_stripped(order_id_s)
+    rules.append((bad_order_id, "missing_order_id"))
 
     # customer_id missing
-    bad_customer = is_missing_text(df["customer_id"])
-    reason[bad_customer] += "|missing_customer_id"
+    bad_customer = _missing_text_from_stripped(customer_id_s)
+    rules.append((bad_customer, "missing_customer_id"))
 
     # timestamp invalid
     invalid_ts = df["order_time_utc"].isna()
-    reason[invalid_ts] += "|invalid_order_time"
+    rules.append((invalid_ts, "invalid_order_time"))
 
     # currency unknown
     unknown_currency = df["currency"].isna()
-    reason[unknown_currency] += "|unknown_currency"
+    rules.append((unknown_currency, "unknown_currency"))
 
     # amount numeric & non-negative
-    amount_num = pd.to_numeric(df["amount"], errors="coerce")
-    missing_amount = amount_num.isna()
-    reason[missing_amount] += "|missing_amount"
+    # plain float64 values: NaN (unparseable / missing) compares False, so the amount
+    # rules below need no separate notna() mask
+    amount_num = pd.to_numeric(df["amount"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    missing_amount = np.isnan(amount_num)
+    rules.append((missing_amount, "missing_amount"))
 
-    neg_amount = amount_num.notna() & (amount_num < 0)
-    reason[neg_amount] += "|negative_amount"
+    neg_amount = amount_num < 0
+    rules.append((neg_amount, "negative_amount"))
 
     # amount/status rules
    
-    status_s = df["status"].astype("string").str.strip().str.lower()
-
-    paid_like = status_s.isin(["paid"])
-    failed_like = status_s.isin(["failed"])
-    refund_like = status_s.isin(["refunded", "chargeback"])
+    # status flags are worked out per category (status is categorical after cleaning)
+    def status_flags(status: pd.Series) -> list:
+        stripped = status.astype(TEXT_DTYPE).str.strip()
+        lowered = stripped.str.lower()
+        return [
+            _missing_text_from_stripped(stripped),
+            lowered.isin(["paid"]),
+            lowered.isin(["failed"]),
+            lowered.isin(["refunded", "chargeback"]),
+        ]
+
+    bad_status, paid_like, failed_like, refund_like = by_category(
+        df["status"], status_flags, [True, False, False, False])
 
     # Policy:
     # - paid: amount must be > 0
     # - failed: amount must be 0 or missing
     # - refunded/chargeback: amount must be > 0 (original purchase amount)
     
-    paid_bad = paid_like & amount_num.notna() & (amount_num <= 0)
-    reason[paid_bad] += "|paid_requires_positive_amount"
+    paid_bad = paid_like & (amount_num <= 0)
+    rules.append((paid_bad, "paid_requires_positive_amount"))
 
-    failed_bad = failed_like & amount_num.notna() & (amount_num > 0)
-    reason[failed_bad] += "|failed_should_not_have_positive_amount"
+    failed_bad = failed_like & (amount_num > 0)
+    rules.append((failed_bad, "failed_should_not_have_positive_amount"))
 
-    refund_bad = refund_like & amount_num.notna() & (amount_num <= 0)
-    reason[refund_bad] += "|refund_requires_positive_amount"
+    refund_bad = refund_like & (amount_num <= 0)
+    rules.append((refund_bad, "refund_requires_positive_amount"))
 
     # If status is missing/blank => quarantine
-    bad_status = is_missing_text(df["status"])
-    reason[bad_status] += "|missing_status"
+    rules.append((bad_status, "missing_status"))
 
     # referential integrity (orders -> customers)
-    customer_set = set(
-        customers_clean["customer_id"].astype("string").str.strip()
-    ) if (customers_clean is not None and "customer_id" in customers_clean.columns) else set()
+    if customer_keys is None:
+        customer_keys = customer_key_index(customers_clean)
 
-    has_customer = ~bad_customer
-    orphan = has_customer & ~df["customer_id"].astype("string").str.strip().isin(customer_set)
-    reason[orphan] += "|orphan_customer_id"
+    orphan = _check_where(~bad_customer, lambda rows: ~isin_keys(customer_id_s[rows], customer_keys))
+    rules.append((orphan, "orphan_customer_id"))
 
     # ingest_date matches partition date (if present)
     if ingest_date is not None and "ingest_date" in df.columns:
-        df_ing = df["ingest_date"].astype("string").str.strip()
-        bad_ingest = df_ing.isna() | (df_ing == "") | (df_ing != str(ingest_date))
-        reason[bad_ingest] += "|ingest_date_mismatch"
-
-  
-    # finalize reject_reason
-    reason = reason.str.strip("|")
-    df["reject_reason"] = reason.replace({"": None})
-
-    quarantine = df[df["reject_reason"].notna()].copy()
-    clean = df[df["reject_reason"].isna()].drop(columns=["reject_reason"]).copy()
+        bad_ingest = ingest_date_mismatch(df["ingest_date"], ingest_date)
+        rules.append((bad_ingest, "ingest_date_mismatch"))
 
     # stats
-   
-    full_row_dup_count = int(df.duplicated(keep=False).sum())
+    id_dupes = df["order_id"].duplicated(keep=False).to_numpy()
+    full_row_dup_count = count_full_row_duplicates(df, id_dupes)
 
-    s_id = df["order_id"].astype("string").str.strip()
-    valid_order_id= s_id.notna() & (s_id != "")
-    order_id_dup_count = int(df.loc[valid_order_id, "order_id"].duplicated(keep=False).sum())
+    valid_order_id = (order_id_s != "").fillna(False).to_numpy(dtype=bool)
+    order_id_dup_count = int((id_dupes & valid_order_id).sum())
 
-    stats = {
-        "total": int(len(df)),
-        "clean": int(len(clean)),
-        "quarantine": int(len(quarantine)),
-        "by_reason": quarantine["reject_reason"].value_counts(dropna=True).to_dict(),
-        "duplicates": {
-            "full_row": full_row_dup_count,
-            "order_id": order_id_dup_count,
-        },
-    }
-
-    return clean, quarantine, stats
+    return apply_rules(df, rules, {"full_row": full_row_dup_count, "order_id": order_id_dup_count})
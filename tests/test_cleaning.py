@@ -0,0 +1,89 @@
+\
+import pandas as pd
+import sys, os
+sys.path.append(os.path.abspath("."))
+
+from src.cleaning import clean_events, clean_events_streaming, clean_orders
+
+
+def test_clean_events_keeps_most_complete_row_per_event_id():
+    """
+    Duplicate event_id rows: the most complete row wins, then the latest
+    event_time; exact ties fall back to the last occurrence.
+    """
+    raw = pd.DataFrame({
+        "event_id": ["e1", "e1", "e1", "e2", "e2"],
+        "customer_id": ["c00001", "c00001", "", "c00002", "c00002"],
+        "event_time": ["2025-12-10 01:00:00", "2025-12-10 02:00:00", "2025-12-10 05:00:00",
+                       "2025-12-10 03:00:00", "2025-12-10 03:00:00"],
+        "event_type": ["login", "login", "login", "login", "error"],
+        "platform": ["ios", "ios", "ios", "web", "web"],
+        "session_id": ["s1", "s2", "s3", "s4", "s5"],
+        "duration_ms": [10, 20, 30, 40, 50],
+        "ingest_date": ["2025-12-10"] * 5,
+    })
+
+    out = clean_events(raw, "2025-12-10").set_index("event_id")
+
+    assert len(out) == 2
+    # row 3 is the latest but has no customer_id -> the later complete row wins
+    assert out.loc["e1", "session_id"] == "s2"
+    # identical completeness + time -> last occurrence
+    assert out.loc["e2", "session_id"] == "s5"
+    assert not any(c.startswith("has_") for c in out.columns)
+
+
+def test_clean_events_streaming_matches_whole_frame():
+    raw = pd.DataFrame({
+        "event_id": ["e1", "e2", "e1", "e3", "e1", "e2", "e3"],
+        "customer_id": ["c00001", "c00002", "", "c00003", "c00001", "c00002", "c00003"],
+        "event_time": ["2025-12-10 01:00:00", "2025-12-10 02:00:00", "2025-12-10 09:00:00",
+                       "bad", "2025-12-10 01:00:00", "2025-12-10 02:00:00", "2025-12-10 04:00:00"],
+        "event_type": ["login", "view", "login", "view", "login", "click", "view"],
+        "platform": ["ios", "web", "ios", "android", "ios", "web", "android"],
+        "session_id": ["s1", "s2", "s3", "s4", "s5", "s6", "s7"],
+        "duration_ms": ["10", "20", "30", "40", "50", "60", "70"],
+        "ingest_date": ["2025-12-10"] * 7,
+    })
+    chunks = [raw.iloc[i:i + 2] for i in range(0, len(raw), 2)]
+
+    whole = clean_events(raw, "2025-12-10").set_index("event_id").sort_index()
+    streamed = clean_events_streaming(chunks, "2025-12-10").set_index("event_id").sort_index()
+
+    assert list(streamed["session_id"]) == list(whole["session_id"]) == ["s5", "s6", "s7"]
+
+
+def test_clean_orders_prefers_parseable_order_time():
+    raw = pd.DataFrame({
+        "order_id": ["o1", "o1"],
+        "customer_id": ["c00001", "c00001"],
+        "order_time": ["2025-12-10T10:00:00+00:00", "not-a-time"],
+        "amount": [10.0, 12.0],
+        "currency": ["USD", "USD"],
+        "status": ["paid", "paid"],
+        "ingest_date": ["2025-12-10", "2025-12-10"],
+    })
+
+    out = clean_orders(raw, "2025-12-10")
+
+    assert len(out) == 1
+    assert out.iloc[0]["amount"] == 10.0
+
+
+def test_clean_orders_does_not_mutate_input():
+    raw = pd.DataFrame({
+        "order_id": [" o1 "],
+        "customer_id": ["C00001"],
+        "order_time": ["2025-12-10T10:00:00+00:00"],
+        "amount": ["10.0"],
+        "currency": ["usd"],
+        "status": ["PAID"],
+        "ingest_date": ["2025-12-10"],
+    })
+    before = raw.copy()
+
+    out = clean_orders(raw, "2025-12-10")
+
+    pd.testing.assert_frame_equal(raw, before)
+    assert out.iloc[0]["currency"] == "USD"
+    assert out.iloc[0]["customer_id"] == "c00001"
@@ -0,0 +1,60 @@
+\
+import pandas as pd
+import sys, os
+sys.path.append(os.path.abspath("."))
+
+from src.io import migrate_single_file_dataset, read_csv, read_date_partitions, write_date_partition
+
+
+def test_date_partitions_overwrite_day_and_merge_breakdowns(tmp_path):
+    """
+    Rewriting a day replaces only that partition; days whose breakdown dicts
+    carry different keys still read back as one table.
+    """
+    root = str(tmp_path / "daily_metrics")
+    write_date_partition(pd.DataFrame({"ingest_date": ["2025-12-10"], "events_clean": [1],
+                                       "orders_by_status": [{"paid": 1}]}), root, "2025-12-10")
+    write_date_partition(pd.DataFrame({"ingest_date": ["2025-12-11"], "events_clean": [2],
+                                       "orders_by_status": [{"refunded": 2, "paid": 3}]}), root, "2025-12-11")
+    # rerun of day 1
+    write_date_partition(pd.DataFrame({"ingest_date": ["2025-12-10"], "events_clean": [5],
+                                       "orders_by_status": [{"paid": 4}]}), root, "2025-12-10")
+
+    out = read_date_partitions(root).sort_values("ingest_date").reset_index(drop=True)
+
+    assert list(out.columns) == ["ingest_date", "events_clean", "orders_by_status"]
+    assert list(out["ingest_date"]) == ["2025-12-10", "2025-12-11"]
+    assert list(out["events_clean"]) == [5, 2]
+    assert out.loc[0, "orders_by_status"] == {"paid": 4, "refunded": None}
+    assert out.loc[1, "orders_by_status"] == {"paid": 3, "refunded": 2}
+
+    hist = read_date_partitions(root, until="2025-12-10", columns=["ingest_date", "events_clean"])
+    assert hist.to_dict("records") == [{"ingest_date": "2025-12-10", "events_clean": 5}]
+    assert read_date_partitions(str(tmp_path / "missing")) is None
+
+
+def test_single_file_metrics_are_split_into_partitions(tmp_path):
+    root = str(tmp_path / "daily_metrics")
+    pd.DataFrame({"ingest_date": ["2025-12-10", "2025-12-11"], "events_clean": [1, 2]}).to_parquet(root + ".parquet")
+    # a day already rerun under the new layout wins over the old file
+    write_date_partition(pd.DataFrame({"ingest_date": ["2025-12-11"], "events_clean": [7]}), root, "2025-12-11")
+
+    migrate_single_file_dataset(root)
+
+    out = read_date_partitions(root).sort_values("ingest_date")
+    assert out.to_dict("records") == [{"ingest_date": "2025-12-10", "events_clean": 1},
+                                      {"ingest_date": "2025-12-11", "events_clean": 7}]
+    assert not (tmp_path / "daily_metrics.parquet").exists()
+
+
+def test_read_csv_kind_allows_missing_ingest_date_and_extra_columns(tmp_path):
+    path = tmp_path / "orders_raw.csv"
+    path.write_text("order_id,customer_id,order_time,amount,currency,status,note\n"
+                    "o1,c00001,2025-12-10 10:00:00,12.50,USD,paid,gift\n")
+
+    for out in (read_csv(str(path), kind="orders"),
+                pd.concat(read_csv(str(path), kind="orders", chunksize=1))):
+        assert list(out.columns) == ["order_id", "customer_id", "order_time", "amount",
+                                     "currency", "status", "note"]
+        assert out.loc[0, "amount"] == "12.50"
+        assert out.loc[0, "note"] == "gift"
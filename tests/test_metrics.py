@@ -195,3 +195,34 @@ def test_compute_daily_metrics_negative_all_empty_inputs():
     assert row["amount_p50"] == pytest.approx(0.0)
     assert row["amount_p95"] == pytest.approx(0.0)
 
+
+
+def test_compute_daily_metrics_duplicate_and_orphan_rates():
+    """
+    Duplicate ids are measured over clean + quarantine together; only rows
+    identical in every column count as full-row duplicates.
+    """
+    customers_clean = pd.DataFrame({"customer_id": ["c1"]})
+    events_clean = pd.DataFrame({
+        "event_id": ["e1", "e2"],
+        "customer_id": ["c1", "c9"],
+        "event_time_utc": pd.to_datetime(["2025-12-10T00:10:00Z", "2025-12-10T01:10:00Z"], utc=True),
+    })
+    events_quarantine = pd.DataFrame({
+        "event_id": ["e1", "e2"],
+        "customer_id": ["c1", "c8"],
+        "event_time_utc": pd.to_datetime(["2025-12-10T00:10:00Z", None], utc=True),
+    })
+    orders = pd.DataFrame(columns=["order_id", "customer_id", "order_time_utc", "amount", "currency", "status"])
+
+    row = compute_daily_metrics(
+        "2025-12-10", customers_clean, customers_clean.iloc[:0],
+        events_clean, events_quarantine, orders, orders,
+    ).iloc[0]
+
+    assert row["duplicate_id_rate_events"] == pytest.approx(1.0)
+    # only the two e1 rows are identical
+    assert row["duplicate_fullrow_rate_events"] == pytest.approx(0.5)
+    assert row["invalid_event_timestamp_rate"] == pytest.approx(0.25)
+    assert row["orphan_customer_rate_events"] == pytest.approx(0.5)
+    assert row["duplicate_fullrow_rate_orders"] == pytest.approx(0.0)
@@ -103,3 +103,92 @@ def test_utils_invalid_inputs():
     assert safe_float("") is None
     assert safe_float("abc") is None
 
+
+def test_series_normalizers_match_scalar_versions():
+    """
+    The vectorized normalizers used by cleaning must agree with the
+    scalar helpers row for row (including messy / missing inputs).
+    """
+    import pandas as pd
+    from src.utils import (
+        is_valid_email_series, normalize_currency_series, normalize_platform_series,
+        normalize_country_series, normalize_order_status_series,
+        normalize_customer_id_series, normalize_customer_status_series, safe_float_series,
+    )
+
+    def same(series_fn, scalar_fn, values):
+        got = series_fn(pd.Series(values, dtype=object)).tolist()
+        expected = [scalar_fn(v) for v in values]
+        got = [None if pd.isna(g) else g for g in got]
+        expected = [None if pd.isna(e) else e for e in expected]
+        assert got == expected
+
+    same(is_valid_email_series, is_valid_email, ["a@b.com", " a@b.com ", "bad", "", None])
+    same(normalize_currency_series, normalize_currency, ["USD", " us d ", "$", "€", "???", None])
+    same(normalize_platform_series, normalize_platform, ["iPhone", " AND ", "web", "tv", "", None])
+    same(normalize_country_series, normalize_country, ["usa", "United Kingdom ", "N/A", "Mars", None])
+    same(normalize_order_status_series, normalize_order_status, ["PAID", "succeeded", "", None])
+    same(normalize_customer_id_series, normalize_customer_id,
+         ["c00001", " C12345 ", "unknown_c00002", "12345", "null", "", None, float("nan")])
+    same(safe_float_series, safe_float, ["12.5", "", "abc", None, 3, float("nan")])
+    same(normalize_customer_status_series, normalize_customer_status,
+         ["active", " Actve ", "INACTIV", "banned", "zzz", "", None])
+
+def test_parse_timestamp_to_utc_series_matches_scalar():
+    """
+    Vectorized timestamp parsing must accept/reject exactly what the scalar
+    parser does (fast-path layout, ISO offsets, epochs, date codes, partial dates,
+    out-of-range years, junk).
+    """
+    import pandas as pd
+    from src.utils import parse_timestamp_to_utc_series
+
+    values = [
+        "2025-12-10 14:41:42", "2025-12-10T04:21:24-05:00", "2025-12-10T10:00:00Z",
+        "Jan 10 2025 5:30PM", "20251210", "1733800000", "1733800000000",
+        "202512", "bad-ts", "", None, "1800-01-01",
+        "18991231", "1733800000123", "176532480012", "99999999999999",
+        "1234567890123456789012", "0000000000",
+        "2025-01", "2025", "2025-01-10", "2025-01-10T10", "2025-W02",
+        "2025-01-10 10:00:00.5+02:00", "2025-01-10T10:00:00.123Z",
+        "9999-12-31 00:00:00", "1600-01-01 00:00:00", "3000-01-01T00:00:00Z",
+        "2300-01-01T00:00:00+00:00", "0001-01-01T00:00:00",
+        "25001231", "22630101", "99991231",
+    ]
+    out = parse_timestamp_to_utc_series(pd.Series(values, dtype=object))
+
+    assert str(out.dt.tz) == "UTC"
+    for value, got in zip(values, out):
+        expected = parse_timestamp_to_utc(value)
+        if expected is None:
+            assert pd.isna(got), value
+        else:
+            assert got == pd.Timestamp(expected), value
+
+def test_parse_timestamp_to_utc_series_keeps_a_non_unique_index():
+    import pandas as pd
+    from src.utils import parse_timestamp_to_utc_series
+
+    series = pd.Series(["20240101", "1700000000", "bad-ts"], index=[0, 0, 1])
+    out = parse_timestamp_to_utc_series(series)
+
+    assert out.index.tolist() == [0, 0, 1]
+    assert out.iloc[0] == pd.Timestamp("2024-01-01", tz="UTC")
+    assert out.iloc[1] == pd.Timestamp(parse_timestamp_to_utc("1700000000"))
+    assert pd.isna(out.iloc[2])
+
+def test_map_unique_calls_func_once_per_distinct_value():
+    import pandas as pd
+    from src.utils import map_unique
+
+    calls = []
+
+    def upper(v):
+        calls.append(v)
+        return None if v is None else v.upper()
+
+    out = map_unique(pd.Series(["a", "b", "a", None, "a"], index=[5, 6, 7, 8, 9]), upper)
+
+    assert out.tolist() == ["A", "B", "A", None, "A"]
+    assert list(out.index) == [5, 6, 7, 8, 9]
+    assert len(calls) == 3  # "a", "b" and the missing value, each once
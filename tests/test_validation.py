@@ -4,7 +4,7 @@ import sys, os
 sys.path.append(os.path.abspath("."))
 
 from src.cleaning import clean_customers, clean_orders
-from src.validation import split_clean_quarantine_orders,split_clean_quarantine_customers
+from src.validation import split_clean_quarantine_orders,split_clean_quarantine_customers,split_clean_quarantine_events,join_reasons,ingest_date_mismatch,isin_keys,is_missing_text
 
 def test_orders_unknown_currency_quarantined():
     raw = pd.DataFrame([{
@@ -148,3 +148,68 @@ def test_split_clean_quarantine_customers_quarantine_reasons_and_stats():
     assert stats["clean"] == 1
     assert stats["quarantine"] == 7
     assert stats["clean"] + stats["quarantine"] == stats["total"]
+
+
+def test_join_reasons_keeps_rule_order_and_leaves_clean_rows_empty():
+    idx = pd.Index([10, 11, 12])
+    out = join_reasons([
+        (pd.Series([True, False, True], index=idx), "first"),
+        (pd.Series([True, False, False], index=idx), "second"),
+    ], idx)
+
+    assert list(out.index) == [10, 11, 12]
+    assert out.dtype == "string[pyarrow]"
+    assert out.isna().tolist() == [False, True, False]
+    assert out.dropna().tolist() == ["first|second", "first"]
+
+    _, by_reason = join_reasons([(pd.Series([True, False, True], index=idx), "first")], idx, return_counts=True)
+    assert by_reason == {"first": 2}
+
+
+def test_ingest_date_mismatch_treats_missing_as_mismatch():
+    raw = pd.Series([" 2025-12-10 ", "2025-12-11", "", None, "nan"])
+    assert ingest_date_mismatch(raw, "2025-12-10").tolist() == [False, True, True, True, True]
+
+
+def test_events_stats_use_the_same_keys_as_other_validators():
+    raw = pd.DataFrame([{
+        "event_id": "e1", "customer_id": "c00001", "event_time_utc": pd.Timestamp("2025-12-10", tz="UTC"),
+        "event_type": "page_view", "platform": "web",
+    }])
+    _, _, stats = split_clean_quarantine_events(raw, pd.DataFrame({"customer_id": ["c00001"]}))
+    assert set(stats) == {"total", "clean", "quarantine", "by_reason", "duplicates"}
+    assert stats["clean"] == 1 and stats["by_reason"] == {}
+
+
+def test_isin_keys_matches_pandas_isin_and_never_matches_nulls():
+    ids = pd.Series(["c00001", None, "c00002", "c00003"])
+    keys = pd.Index(["c00001", "c00003"], dtype="string[pyarrow]")
+    assert isin_keys(ids, keys).tolist() == ids.isin(keys).tolist() == [True, False, False, True]
+
+
+def test_empty_orders_batch_returns_zero_stats_and_reject_reason_column():
+    raw = pd.DataFrame(columns=["order_id", "customer_id", "order_time_utc", "amount", "currency", "status"])
+    clean, quarantine, stats = split_clean_quarantine_orders(raw, pd.DataFrame({"customer_id": ["c00001"]}))
+    assert clean.empty and quarantine.empty and "reject_reason" in quarantine.columns
+    assert stats == {"total": 0, "clean": 0, "quarantine": 0, "by_reason": {},
+                     "duplicates": {"full_row": 0, "order_id": 0}}
+
+
+def test_text_rules_give_the_same_answer_on_categorical_columns():
+    raw = pd.Series([" 2025-12-10", "NULL", None, "2025-12-11", "", "2025-12-10"])
+    cat = raw.astype("category")
+    assert is_missing_text(cat).tolist() == is_missing_text(raw).tolist() == [False, True, True, False, True, False]
+    assert ingest_date_mismatch(cat, "2025-12-10").tolist() == ingest_date_mismatch(raw, "2025-12-10").tolist()
+
+
+def test_join_reasons_keeps_rules_past_the_eighth_bit():
+    idx = pd.RangeIndex(3)
+    rules = [(pd.Series([False, False, False]), f"rule_{i}") for i in range(12)]
+    rules[9] = (pd.Series([True, False, False]), "rule_9")
+    rules[11] = (pd.Series([True, False, True]), "rule_11")
+
+    out, by_reason = join_reasons(rules, idx, return_counts=True)
+
+    assert out.isna().tolist() == [False, True, False]
+    assert out.dropna().tolist() == ["rule_9|rule_11", "rule_11"]
+    assert by_reason == {"rule_9|rule_11": 1, "rule_11": 1}